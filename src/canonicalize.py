@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import sys
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 
 from .models import PostalAddress
 
@@ -81,36 +82,69 @@ _US_STATE_NAME_TO_CODE = {
     "wyoming": "WY",
 }
 
+# Canonical tokens are interned so equal keys usually share the same object
+# (str == checks identity before comparing characters).
+_US = sys.intern("us")
+_UNIT_TYPE_SYNONYMS = {k: sys.intern(v) for k, v in _UNIT_TYPE_SYNONYMS.items()}
+_US_STATE_NAME_TO_CODE = {k: sys.intern(v) for k, v in _US_STATE_NAME_TO_CODE.items()}
 
-def _collapse_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+# Compiled once at import; these run several times per address_keys() call.
+_RE_NON_ALNUM_RUN = re.compile(r"[^a-z0-9]+")
+_RE_NON_DIGIT = re.compile(r"\D")
+_RE_NON_ALNUM_UPPER = re.compile(r"[^A-Z0-9]")
 
 
-def _strip_punct_keep_alnum_space(s: str) -> str:
-    # Keep letters/digits/spaces; drop punctuation like . , # etc.
-    return re.sub(r"[^a-z0-9\s]", " ", s)
+def _build_ascii_norm_table() -> dict:
+    # ASCII version of the slow path in normalize_text():
+    # A-Z -> a-z, letters/digits/whitespace kept, everything else -> space.
+    table = {}
+    for i in range(128):
+        c = chr(i)
+        if "A" <= c <= "Z":
+            table[i] = c.lower()
+        elif not (c.isalnum() or c.isspace()):
+            table[i] = " "
+    return table
 
 
+_ASCII_NORM_TABLE = _build_ascii_norm_table()
+
+# Deletes every ASCII non-digit (ZIP fast path).
+_ASCII_DIGITS_ONLY_TABLE = str.maketrans("", "", "".join(chr(i) for i in range(128) if not chr(i).isdigit()))
+
+# Deletes every ASCII char outside A-Z/0-9 (unit number fast path).
+_ASCII_UNIT_TABLE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not ("A" <= chr(i) <= "Z" or "0" <= chr(i) <= "9"))
+)
+
+# The normalizers below are pure str -> str functions and see heavy repetition
+# (same city/state/country on every entry), so they are memoized.
+_NORMALIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_text(s: Optional[str]) -> Optional[str]:
     if s is None:
         return None
-    t = _collapse_whitespace(s.strip().lower())
-    if not t:
-        return None
-    t = _strip_punct_keep_alnum_space(t)
-    t = _collapse_whitespace(t)
-    return t or None
+    if s.isascii():
+        # Fast path: one translate pass + split/join instead of two regex passes.
+        return " ".join(s.translate(_ASCII_NORM_TABLE).split()) or None
+    # Keep a-z/0-9 only; each run of anything else (punctuation like . , #,
+    # whitespace, non-ASCII) becomes one space, in a single regex pass.
+    return _RE_NON_ALNUM_RUN.sub(" ", s.lower()).strip() or None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_country(country: Optional[str]) -> Optional[str]:
     c = normalize_text(country)
     if c is None:
         return None
     if c in _US_COUNTRY_ALIASES:
-        return "us"
-    return c
+        return _US
+    return sys.intern(c)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_state(state: Optional[str]) -> Optional[str]:
     """
     Normalize state/province.
@@ -119,22 +153,35 @@ def normalize_state(state: Optional[str]) -> Optional[str]:
     - If state is a full US state name -> map to 2-letter code (e.g., "north carolina" -> "NC")
     - Otherwise return normalized text (useful for non-US provinces/regions)
     """
+    if state is None:
+        return None
+
+    # Fast path on the raw value: most inputs are already "NC"/"nc" or a plain
+    # state name, which need no punctuation/whitespace normalization.
+    raw = state.strip()
+    if len(raw) == 2 and raw.isascii() and raw.isalpha():
+        return sys.intern(raw.upper())
+    mapped = _US_STATE_NAME_TO_CODE.get(raw.lower())
+    if mapped:
+        return mapped
+
     s = normalize_text(state)
     if s is None:
         return None
 
     # Already a 2-letter code
-    if re.fullmatch(r"[a-z]{2}", s):
-        return s.upper()
+    if len(s) == 2 and s.isascii() and s.isalpha():
+        return sys.intern(s.upper())
 
     # Map common US state names
     mapped = _US_STATE_NAME_TO_CODE.get(s)
     if mapped:
         return mapped
 
-    return s
+    return sys.intern(s)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_zip(zip_code: Optional[str]) -> Optional[str]:
     """
     Normalize to ZIP5 when possible.
@@ -148,41 +195,41 @@ def normalize_zip(zip_code: Optional[str]) -> Optional[str]:
     if not z:
         return None
 
-    digits = re.sub(r"\D", "", z)
+    # ASCII input: delete non-digits with one translate; otherwise keep regex (Unicode \d)
+    digits = z.translate(_ASCII_DIGITS_ONLY_TABLE) if z.isascii() else _RE_NON_DIGIT.sub("", z)
     if len(digits) >= 5:
         return digits[:5]  # ZIP5 for matching
     return digits or None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_unit_type(unit_type: Optional[str]) -> Optional[str]:
     if unit_type is None:
         return None
     t = normalize_text(unit_type)
     if t is None:
         return None
-    return _UNIT_TYPE_SYNONYMS.get(t, t)
+    return _UNIT_TYPE_SYNONYMS.get(t) or sys.intern(t)
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_unit_number(unit_number: Optional[str]) -> Optional[str]:
     # accepts USCISUnitType or free text
     if unit_number is None:
         return None
-    u = unit_number.strip()
-    if not u:
-        return None
-    # remove spaces, uppercase (2a -> 2A, " 2 A " -> "2A")
-    u = re.sub(r"\s+", "", u).upper()
-    # strip punctuation
-    u = re.sub(r"[^A-Z0-9]", "", u)
+    # uppercase, then drop spaces + punctuation (2a -> 2A, " 2 A " -> "2A", "2-A" -> "2A").
+    # Checked after upper(): non-ASCII can uppercase to ASCII (e.g. "ß" -> "SS").
+    u = unit_number.upper()
+    u = u.translate(_ASCII_UNIT_TABLE) if u.isascii() else _RE_NON_ALNUM_UPPER.sub("", u)
     return u or None
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
 def normalize_street(street: Optional[str]) -> Optional[str]:
     return normalize_text(street)
 
 
-@dataclass(frozen=True)
-class AddressKeys:
+class AddressKeys(NamedTuple):
     """
     strict_key: includes unit + ZIP5 when available (strongest match)
     loose_key:  excludes unit and zip (useful for near-match detection)
@@ -191,6 +238,85 @@ class AddressKeys:
     loose_key: str
 
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def canonicalize_address_fields(
+    state_province: Optional[str],
+    zip_code: Optional[str],
+    country: Optional[str],
+) -> Tuple[str, str, str]:
+    """
+    Return (state, zip5, country) tokens for one address in a single call.
+
+    The state/ZIP/country triple is usually identical across a person's whole
+    timeline, so one cache probe here replaces three separate normalizer calls.
+    Missing fields become empty tokens.
+    """
+    return (
+        normalize_state(state_province) or "",
+        normalize_zip(zip_code) or "",
+        normalize_country(country) or "",
+    )
+
+
+_RawAddressFields = Tuple[
+    str, Optional[str], Optional[str], str, Optional[str], Optional[str], str
+]
+
+
+def _raw_fields(addr: PostalAddress) -> _RawAddressFields:
+    """The raw values the keys depend on (PostalAddress itself is not hashable)."""
+    return (
+        addr.street_name,
+        addr.unit_type,
+        addr.unit_number,
+        addr.city,
+        addr.state_province,
+        addr.zip_code,
+        addr.country,
+    )
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _tokens_for_fields(
+    street_name: str,
+    unit_type: Optional[str],
+    unit_number: Optional[str],
+    city: str,
+    state_province: Optional[str],
+    zip_code: Optional[str],
+    country: str,
+) -> Tuple[str, str, str, str, str, str, str]:
+    """
+    Normalize every key field once:
+      (street, unit_type, unit_number, city, state, zip5, country)
+
+    Missing fields become empty tokens (stable shape). Normalized tokens never
+    contain "|", so comparing token tuples is equivalent to comparing keys.
+    """
+    state, zip5, country_token = canonicalize_address_fields(state_province, zip_code, country)
+    return (
+        normalize_street(street_name) or "",
+        normalize_unit_type(unit_type) or "",
+        normalize_unit_number(unit_number) or "",
+        normalize_text(city) or "",
+        state,
+        zip5,
+        country_token,
+    )
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _keys_for_fields(*fields: Optional[str]) -> AddressKeys:
+    street, unit_type, unit_number, city, state, zip5, country = _tokens_for_fields(*fields)
+
+    # interned so equal keys from different raw spellings are one object and
+    # key comparisons in the residency sweep hit the identity fast path
+    strict = sys.intern(f"{street}|{unit_type}|{unit_number}|{city}|{state}|{zip5}|{country}")
+    loose = sys.intern(f"{street}|{city}|{state}|{country}")
+
+    return AddressKeys(strict_key=strict, loose_key=loose)
+
+
 def address_keys(addr: PostalAddress) -> AddressKeys:
     """
     Build deterministic keys for matching addresses across people.
@@ -202,28 +328,25 @@ def address_keys(addr: PostalAddress) -> AddressKeys:
       street | city | state | country
 
     Missing fields become empty tokens (stable shape).
-    """
-    street = normalize_street(addr.street_name) or ""
-    city = normalize_text(addr.city) or ""
-    state = normalize_state(addr.state_province) or ""
-    country = normalize_country(addr.country) or ""
-    zip5 = normalize_zip(addr.zip_code) or ""
-
-    unit_type = normalize_unit_type(addr.unit_type) or ""
-    unit_number = normalize_unit_number(addr.unit_number) or ""
-
-    strict = "|".join([street, unit_type, unit_number, city, state, zip5, country])
-    loose = "|".join([street, city, state, country])
 
-    return AddressKeys(strict_key=strict, loose_key=loose)
+    Keys are memoized on the raw field values, so repeated lookups for the same
+    address (same instance or an equal copy) are computed once. Keying on values
+    rather than identity stays correct if a PostalAddress is mutated or its id()
+    is reused.
+    """
+    return _keys_for_fields(*_raw_fields(addr))
 
 
 def compare_addresses(a: PostalAddress, b: PostalAddress) -> Tuple[bool, bool]:
     """
     Return (strict_match, loose_match).
+
+    Compares normalized token tuples directly (short-circuits on the first
+    differing field) instead of building and comparing key strings.
     """
-    ak = address_keys(a)
-    bk = address_keys(b)
-    strict_match = ak.strict_key == bk.strict_key
-    loose_match = ak.loose_key == bk.loose_key
+    at = _tokens_for_fields(*_raw_fields(a))
+    bt = _tokens_for_fields(*_raw_fields(b))
+    # loose fields: street, city, state, country
+    loose_match = at[0] == bt[0] and at[3] == bt[3] and at[4] == bt[4] and at[6] == bt[6]
+    strict_match = loose_match and at[1] == bt[1] and at[2] == bt[2] and at[5] == bt[5]
     return strict_match, loose_match
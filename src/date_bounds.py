@@ -0,0 +1,121 @@
+# src/date_bounds.py
+
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Optional, Tuple, TypeVar
+
+from .models import AddressEntry, DatePrecision, EmploymentEntry
+
+
+# days in each month (index 1..12) for a non-leap year
+_MONTH_END = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(y: int) -> bool:
+    return (y % 4 == 0 and y % 100 != 0) or y % 400 == 0
+
+
+def _year_start_ordinal(y: int) -> int:
+    # proleptic Gregorian ordinal of Jan 1 (same arithmetic as date.toordinal)
+    y1 = y - 1
+    return y1 * 365 + y1 // 4 - y1 // 100 + y1 // 400 + 1
+
+
+def last_day_of_month(y: int, m: int) -> int:
+    """Day-of-month number of the last day of month m in year y."""
+    if m == 2 and _is_leap(y):
+        return 29
+    return _MONTH_END[m]
+
+
+def precision_range_start(d: date, precision: DatePrecision) -> int:
+    """Ordinal of the earliest possible date for the given precision."""
+    if precision == "day":
+        return d.toordinal()
+    if precision == "month":
+        return d.toordinal() - d.day + 1
+    # year
+    return _year_start_ordinal(d.year)
+
+
+def precision_range_end(d: date, precision: DatePrecision) -> int:
+    """Ordinal of the latest possible date for the given precision."""
+    if precision == "day":
+        return d.toordinal()
+    if precision == "month":
+        return d.toordinal() - d.day + last_day_of_month(d.year, d.month)
+    # year
+    return _year_start_ordinal(d.year + 1) - 1
+
+
+@lru_cache(maxsize=2048)
+def entry_bounds(
+    date_from: date,
+    from_precision: DatePrecision,
+    date_to: Optional[date],
+    to_precision: DatePrecision,
+) -> Tuple[int, Optional[int]]:
+    """
+    Precision-expanded (start, end) of an entry as date ordinals.
+    end is None for date_to=None ("Present"), which the caller resolves to window_end.
+
+    Memoized on the entry's own date fields (not the entry object, which is
+    mutable), so address/employment validators, joint residency and travel
+    checks share one expansion per distinct entry.
+    """
+    start = precision_range_start(date_from, from_precision)
+    if date_to is None:
+        return start, None
+    return start, precision_range_end(date_to, to_precision)
+
+
+_E = TypeVar("_E", AddressEntry, EmploymentEntry)
+
+# Sort key for ranges: (start_ord, end_ord). A C-level getter instead of a lambda;
+# a bare tuple sort would compare the entry models on (start, end) ties.
+_ORDINAL_BOUNDS = itemgetter(0, 1)
+
+
+def build_ranges(
+    entries: List[_E],
+    *,
+    window_start: date,
+    window_end: date,
+) -> List[Tuple[int, int, _E]]:
+    """
+    Convert AddressEntry/EmploymentEntry records into clamped coverage ranges
+    within [window_start, window_end], as (start_ordinal, end_ordinal, entry).
+
+    Each entry covers:
+      start = earliest possible date based on from_precision
+      end   = latest possible date based on to_precision
+
+    date_to=None means "Present", treated as covering through window_end with day precision.
+    Detectors do their math on the ordinals and only build dates for reported issues.
+    """
+    ws = window_start.toordinal()
+    we = window_end.toordinal()
+    ranges: List[Tuple[int, int, _E]] = []
+
+    for entry in entries:
+        start, end = entry_bounds(entry.date_from, entry.from_precision, entry.date_to, entry.to_precision)
+        if end is None:
+            end = we
+
+        # Ignore entries fully outside window
+        if end < ws or start > we:
+            continue
+
+        # Clamp to window
+        if start < ws:
+            start = ws
+        if end > we:
+            end = we
+
+        ranges.append((start, end, entry))
+
+    ranges.sort(key=_ORDINAL_BOUNDS)
+    return ranges
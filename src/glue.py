@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import re
+import sys
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple, Literal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Literal
+from .canonicalize import normalize_country
 from .issues import tag_issues
 
 from .models import (
@@ -40,27 +42,57 @@ class RawSnapshot:
 # ======================================================
 # Country/state helpers (gentle USCIS-aligned warnings)
 # ======================================================
-
-def _is_us_country(country: str) -> bool:
-    c = country.strip().lower()
-    return c in {"us", "usa", "united states", "united states of america"}
-
+# U.S. detection uses canonicalize.normalize_country (canonical "us").
 
 def _looks_like_state_code(state: str) -> bool:
-    return bool(re.fullmatch(r"[A-Za-z]{2}", state.strip()))
+    s = state.strip()
+    return len(s) == 2 and s.isascii() and s.isalpha()
 
 
 # ======================================================
-# Date helpers
+# Issue templates
 # ======================================================
+# Issue is frozen, so Issues whose text depends only on the field label can be
+# built once and shared; tag_issues() copies them when it fills in ref_id.
+
+@lru_cache(maxsize=256)
+def _missing_field_issue(
+    field_label: str,
+    issues_category: str,
+    severity: Literal["high", "medium", "low"],
+) -> Issue:
+    return Issue(
+        severity=severity,
+        category=issues_category,
+        message=f"Missing required field: {field_label}.",
+        suggested_question=f"Please provide {field_label}.",
+    )
+
+
+@lru_cache(maxsize=256)
+def _present_not_allowed_issue(field_label: str, issues_category: str) -> Issue:
+    return Issue(
+        severity="high",
+        category=issues_category,
+        message=f"{field_label}: 'Present' is not allowed here.",
+        suggested_question=(f"Please provide an actual date for {field_label} "
+                            f"({_ALLOWED_FORMATS_NO_PRESENT})."
+        ),
+    )
 
-def _fmt_allowed_formats_with_present() -> str:
-    return "YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY, YYYY-MM, YYYY/MM, MM/YYYY, MM-YYYY, YYYY, or 'Present'"
 
+# ======================================================
+# Date helpers
+# ======================================================
 
-def _fmt_allowed_formats_no_present() -> str:
-    return "YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY, YYYY-MM, YYYY/MM, MM/YYYY, MM-YYYY, or YYYY"
+_ALLOWED_FORMATS_WITH_PRESENT = "YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY, YYYY-MM, YYYY/MM, MM/YYYY, MM-YYYY, YYYY, or 'Present'"
+_ALLOWED_FORMATS_NO_PRESENT = "YYYY-MM-DD, YYYY/MM/DD, MM/DD/YYYY, YYYY-MM, YYYY/MM, MM/YYYY, MM-YYYY, or YYYY"
 
+# Tail of the invalid-date suggested_question, keyed by allow_present
+_INVALID_DATE_QUESTION_TAIL = {
+    True: f" in one of: {_ALLOWED_FORMATS_WITH_PRESENT}.",
+    False: f" in one of: {_ALLOWED_FORMATS_NO_PRESENT}.",
+}
 
 
 def require_date(
@@ -87,17 +119,7 @@ def require_date(
 
     if nd.is_present:
         if not allow_present:
-            issues.append(
-                Issue(
-                    severity="high",
-                    category=issues_category,
-                    message=f"{field_label}: 'Present' is not allowed here.",
-                    suggested_question=(f"Please provide an actual date for {field_label} " 
-                                        f"({_fmt_allowed_formats_no_present()})."
-                    ),
-
-                )
-            )
+            issues.append(_present_not_allowed_issue(field_label, issues_category))
             return None, "unknown", False, issues
 
         # Caller decides how to represent Present; for models we typically store date_to=None
@@ -110,10 +132,9 @@ def require_date(
                 severity="high",
                 category=issues_category,
                 message=f"Invalid or unrecognized date for {field_label}: {raw_display!r}.",
-                suggested_question=(f"Please provide a valid date for {field_label} in one of: "
-                                    f"{_fmt_allowed_formats_with_present() if allow_present else _fmt_allowed_formats_no_present()}."
+                suggested_question=(
+                    f"Please provide a valid date for {field_label}{_INVALID_DATE_QUESTION_TAIL[bool(allow_present)]}"
                 ),
-
             )
         )
         return None, "unknown", False, issues
@@ -129,18 +150,51 @@ def _require_str(
     issues_category: str,
     severity: Literal["high", "medium", "low"] = "high",
 ) -> Tuple[Optional[str], List[Issue]]:
+    value = str(raw_value).strip() if raw_value is not None else ""
+    if not value:
+        return None, [_missing_field_issue(field_label, issues_category, severity)]
+    return value, []
+
+
+# ======================================================
+# List glue (shared by address/employment/travel)
+# ======================================================
+
+@lru_cache(maxsize=4096)
+def _ref_id(id_prefix: str, idx: int) -> str:
+    """ref_id "<id_prefix>_<idx>"; the same ids recur for every case, so cache + intern them."""
+    return sys.intern(f"{id_prefix}_{idx}")
+
+
+def _parse_list(
+    raw_list: List[Dict[str, Any]],
+    parse_entry: Callable[..., Tuple[Optional[Any], List[Issue], RawSnapshot]],
+    *,
+    id_prefix: str,
+    assume_us_mdy: bool,
+) -> Tuple[List[Any], List[Issue], List[RawSnapshot]]:
+    """
+    Run parse_entry over raw_list with ref_ids "<id_prefix>_<idx>".
+    Never silently drops errors: invalid entries yield issues + snapshots with IDs.
+    """
+    entries: List[Any] = []
     issues: List[Issue] = []
-    if raw_value is None or not str(raw_value).strip():
-        issues.append(
-            Issue(
-                severity=severity,
-                category=issues_category,
-                message=f"Missing required field: {field_label}.",
-                suggested_question=f"Please provide {field_label}.",
-            )
-        )
-        return None, issues
-    return str(raw_value).strip(), issues
+    snapshots: List[RawSnapshot] = []
+
+    # Bind hot-loop methods once
+    entries_append = entries.append
+    issues_extend = issues.extend
+    snapshots_append = snapshots.append
+
+    ref_ids = [_ref_id(id_prefix, idx) for idx in range(len(raw_list))]
+    for raw, ref_id in zip(raw_list, ref_ids):
+        entry, entry_issues, snap = parse_entry(raw, ref_id=ref_id, assume_us_mdy=assume_us_mdy)
+        snapshots_append(snap)
+        issues_extend(entry_issues)
+        if entry is not None:
+            entries_append(entry)
+
+    return entries, issues, snapshots
 
 
 # ======================================================
@@ -179,7 +233,8 @@ def parse_postal_address(
     # Gentle warning: US state code format (do NOT hard-fail)
     state_raw = raw.get("state_province")
     if isinstance(state_raw, str) and state_raw.strip():
-        if _is_us_country(country) and not _looks_like_state_code(state_raw):
+        canon_country = normalize_country(country)
+        if canon_country == "us" and not _looks_like_state_code(state_raw):
             issues.append(
                 Issue(
                     severity="medium",
@@ -311,19 +366,7 @@ def parse_address_list(
     Parse a list of raw address dicts into AddressEntry objects.
     Never silently drops errors: invalid entries yield issues + snapshots with IDs.
     """
-    entries: List[AddressEntry] = []
-    issues: List[Issue] = []
-    snapshots: List[RawSnapshot] = []
-
-    for idx, raw in enumerate(raw_list):
-        ref_id = f"{id_prefix}_{idx}"
-        entry, entry_issues, snap = parse_address_entry(raw, ref_id=ref_id, assume_us_mdy=assume_us_mdy)
-        snapshots.append(snap)
-        issues.extend(entry_issues)
-        if entry is not None:
-            entries.append(entry)
-
-    return entries, issues, snapshots
+    return _parse_list(raw_list, parse_address_entry, id_prefix=id_prefix, assume_us_mdy=assume_us_mdy)
 
 
 # ======================================================
@@ -420,19 +463,7 @@ def parse_employment_list(
     assume_us_mdy: bool = True,
     id_prefix: str = "emp",
 ) -> Tuple[List[EmploymentEntry], List[Issue], List[RawSnapshot]]:
-    entries: List[EmploymentEntry] = []
-    issues: List[Issue] = []
-    snapshots: List[RawSnapshot] = []
-
-    for idx, raw in enumerate(raw_list):
-        ref_id = f"{id_prefix}_{idx}"
-        entry, entry_issues, snap = parse_employment_entry(raw, ref_id=ref_id, assume_us_mdy=assume_us_mdy)
-        snapshots.append(snap)
-        issues.extend(entry_issues)
-        if entry is not None:
-            entries.append(entry)
-
-    return entries, issues, snapshots
+    return _parse_list(raw_list, parse_employment_entry, id_prefix=id_prefix, assume_us_mdy=assume_us_mdy)
 
 
 # ======================================================
@@ -507,16 +538,4 @@ def parse_travel_list(
     assume_us_mdy: bool = True,
     id_prefix: str = "trv",
 ) -> Tuple[List[TravelEntry], List[Issue], List[RawSnapshot]]:
-    entries: List[TravelEntry] = []
-    issues: List[Issue] = []
-    snapshots: List[RawSnapshot] = []
-
-    for idx, raw in enumerate(raw_list):
-        ref_id = f"{id_prefix}_{idx}"
-        entry, entry_issues, snap = parse_travel_entry(raw, ref_id=ref_id, assume_us_mdy=assume_us_mdy)
-        snapshots.append(snap)
-        issues.extend(entry_issues)
-        if entry is not None:
-            entries.append(entry)
-
-    return entries, issues, snapshots
+    return _parse_list(raw_list, parse_travel_entry, id_prefix=id_prefix, assume_us_mdy=assume_us_mdy)
@@ -7,36 +7,29 @@ from typing import List, Optional
 from .validate import Issue
 
 
+def _with_ref_id(issue: Issue, ref_id: str) -> Issue:
+    """
+    Copy of an (immutable) Issue with ref_id set.
+    ref_id is the last field, so this is a single positional tuple build
+    (cheaper than NamedTuple._replace's keyword/map round-trip).
+    """
+    return Issue(*issue[:-1], ref_id)
+
+
 def tag_issues(issues: List[Issue], ref_id: str) -> List[Issue]:
     """
-    Return a new list of Issues with ref_id populated when missing.
-    (Issue is frozen/immutable, so we construct new Issue objects.)
+    Return a list of Issues with ref_id populated when missing.
+    (Issue is immutable, so we construct new Issue objects.)
+
+    If every issue is already tagged, the input list is returned as-is.
     """
-    tagged: List[Issue] = []
-    for i in issues:
-        if i.ref_id is None:
-            tagged.append(
-                Issue(
-                    severity=i.severity,
-                    category=i.category,
-                    message=i.message,
-                    suggested_question=i.suggested_question,
-                    ref_id=ref_id,
-                )
-            )
-        else:
-            tagged.append(i)
-    return tagged
+    if all(i.ref_id is not None for i in issues):
+        return issues
+    return [i if i.ref_id is not None else _with_ref_id(i, ref_id) for i in issues]
 
 
 def tag_issue(issue: Issue, ref_id: str) -> Issue:
     """Tag a single Issue if it doesn't already have a ref_id."""
     if issue.ref_id is not None:
         return issue
-    return Issue(
-        severity=issue.severity,
-        category=issue.category,
-        message=issue.message,
-        suggested_question=issue.suggested_question,
-        ref_id=ref_id,
-    )
+    return _with_ref_id(issue, ref_id)
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import List, Optional, Literal, Tuple
+from datetime import date
+from typing import Dict, List, Optional, Literal, Tuple
 
-from .models import AddressEntry, ImmigrationCase, DatePrecision
+from .date_bounds import entry_bounds
+from .models import AddressEntry, ImmigrationCase
 from .validate import Issue
 from .canonicalize import address_keys
 
@@ -14,16 +16,18 @@ from .canonicalize import address_keys
 MatchType = Literal["strict", "loose"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddressRange:
-    start: date
-    end: date
+    # date ordinals (date.toordinal()): the sweep only compares them, and
+    # dates are rebuilt once per shared window
+    start: int
+    end: int
     entry: AddressEntry
     strict_key: str
     loose_key: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SharedResidenceWindow:
     start: date
     end: date
@@ -32,7 +36,7 @@ class SharedResidenceWindow:
     beneficiary_entry: AddressEntry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JointResidencyResult:
     first_shared_date: Optional[date]
     match_type: Optional[MatchType]
@@ -40,30 +44,6 @@ class JointResidencyResult:
     issues: List[Issue]
 
 
-def _last_day_of_month(y: int, m: int) -> date:
-    if m == 12:
-        return date(y, 12, 31)
-    return date(y, m + 1, 1) - timedelta(days=1)
-
-
-def _precision_range_start(d: date, precision: DatePrecision) -> date:
-    if precision == "day":
-        return d
-    if precision == "month":
-        return date(d.year, d.month, 1)
-    # year
-    return date(d.year, 1, 1)
-
-
-def _precision_range_end(d: date, precision: DatePrecision) -> date:
-    if precision == "day":
-        return d
-    if precision == "month":
-        return _last_day_of_month(d.year, d.month)
-    # year
-    return date(d.year, 12, 31)
-
-
 def _build_ranges(
     addresses: List[AddressEntry],
     *,
@@ -71,21 +51,23 @@ def _build_ranges(
     window_end: date,
 ) -> List[AddressRange]:
     ranges: List[AddressRange] = []
+    ws = window_start.toordinal()
+    we = window_end.toordinal()
 
     for entry in addresses:
-        start = _precision_range_start(entry.date_from, entry.from_precision)
-
-        effective_end = entry.date_to or window_end
-        end_precision: DatePrecision = entry.to_precision if entry.date_to is not None else "day"
-        end = _precision_range_end(effective_end, end_precision)
+        start, end = entry_bounds(entry.date_from, entry.from_precision, entry.date_to, entry.to_precision)
+        if end is None:
+            end = we  # Present: day precision through window_end
 
         # ignore outside window
-        if end < window_start or start > window_end:
+        if end < ws or start > we:
             continue
 
         # clamp to window
-        start = max(start, window_start)
-        end = min(end, window_end)
+        if start < ws:
+            start = ws
+        if end > we:
+            end = we
 
         keys = address_keys(entry.address)
         ranges.append(
@@ -102,12 +84,32 @@ def _build_ranges(
     return ranges
 
 
-def _overlap(a_start: date, a_end: date, b_start: date, b_end: date) -> Optional[Tuple[date, date]]:
-    start = max(a_start, b_start)
-    end = min(a_end, b_end)
-    if start <= end:
-        return start, end
-    return None
+# Per-call constants of detect_joint_residency_start, built once.
+_PRIORITY: Dict[MatchType, int] = {"strict": 0, "loose": 1}
+
+_NO_OVERLAP_MESSAGE = (
+    "No shared residential address overlap was detected between petitioner and beneficiary in the selected window."
+)
+
+# Fully static (Issue is frozen), so one shared instance serves every call.
+_LOOSE_ONLY_ISSUE = Issue(
+    severity="medium",
+    category="joint_residency",
+    ref_id="joint_residency",
+    message=(
+        "A possible shared residence was detected, but only via loose address matching "
+        "(unit/ZIP differences may exist)."
+    ),
+    suggested_question=(
+        "Please confirm your shared residence address details (unit/apartment and ZIP). "
+        "If you lived together, which exact address should be used on the forms?"
+    ),
+)
+
+
+def _found_sort_key(f: Tuple[int, int, int, int, int, AddressRange, AddressRange, MatchType]) -> Tuple[int, ...]:
+    # (start, priority, end, pet_idx, ben_idx)
+    return f[:5]
 
 
 def detect_joint_residency_start(
@@ -115,6 +117,7 @@ def detect_joint_residency_start(
     *,
     window_start: date,
     window_end: date,
+    materialize_windows: bool = True,
 ) -> JointResidencyResult:
     """
     Find earliest shared residential window between petitioner and beneficiary.
@@ -130,51 +133,97 @@ def detect_joint_residency_start(
       - issues:
           * if only loose matches exist -> medium (near-match; unit/zip differences)
           * if no shared window exists -> medium (living arrangement clarification)
+
+    materialize_windows=False is for callers that only need first_shared_date /
+    match_type / issues: those are computed the same way, but windows is
+    returned empty (no per-window objects, no sort).
+
+    Complexity: O((N+M) log(N+M) + K) for N petitioner / M beneficiary ranges and
+    K overlapping pairs. The sweep only ever pairs ranges that truly overlap, so
+    a separate interval index would not reduce the work.
     """
     pet_ranges = _build_ranges(case.petitioner.addresses_lived, window_start=window_start, window_end=window_end)
     ben_ranges = _build_ranges(case.beneficiary.addresses_lived, window_start=window_start, window_end=window_end)
 
-    windows: List[SharedResidenceWindow] = []
-
-    # Brute force is OK for small lists (typical USCIS timelines). Optimize later if needed.
-    for pr in pet_ranges:
-        for br in ben_ranges:
-            ov = _overlap(pr.start, pr.end, br.start, br.end)
-            if not ov:
-                continue
-
-            # strict match first
-            if pr.strict_key == br.strict_key:
-                windows.append(
-                    SharedResidenceWindow(
-                        start=ov[0],
-                        end=ov[1],
-                        match_type="strict",
-                        petitioner_entry=pr.entry,
-                        beneficiary_entry=br.entry,
-                    )
-                )
-                continue
-
-            # loose match as fallback
-            if pr.loose_key == br.loose_key:
-                windows.append(
-                    SharedResidenceWindow(
-                        start=ov[0],
-                        end=ov[1],
-                        match_type="loose",
-                        petitioner_entry=pr.entry,
-                        beneficiary_entry=br.entry,
-                    )
-                )
-
-    if not windows:
+    # Sweep-line over both sides in start order. When a range starts, every
+    # still-active range from the other side (end >= this start) overlaps it,
+    # so each overlapping pair is examined exactly once instead of N*M checks.
+    #
+    # Active ranges are bucketed by loose_key: a strict match implies a loose
+    # match (strict_key has every loose token), so ranges in other buckets can
+    # never match and are not even looked at.
+    merged = heapq.merge(
+        [(pr.start, 0, i, pr) for i, pr in enumerate(pet_ranges)],
+        [(br.start, 1, j, br) for j, br in enumerate(ben_ranges)],
+    )
+    active: Tuple[Dict[str, List[Tuple[int, AddressRange]]], Dict[str, List[Tuple[int, AddressRange]]]] = ({}, {})
+
+    # (start, priority, end, pet_idx, ben_idx, pr, br, match_type)
+    found: List[Tuple[int, int, int, int, int, AddressRange, AddressRange, MatchType]] = []
+    # earliest window (same order as the sort below) and "any strict?" are tracked while pairing
+    best: Optional[Tuple[int, int, int, int, int, AddressRange, AddressRange, MatchType]] = None
+    has_strict = False
+    # Once the sweep passes the latest end on either side, nothing that starts
+    # later can overlap anything (this also covers an empty side).
+    stop_after = min(
+        max((pr.end for pr in pet_ranges), default=-1),
+        max((br.end for br in ben_ranges), default=-1),
+    )
+    for start, side, idx, rng in merged:
+        if start > stop_after:
+            break
+        if rng.end < start:
+            continue  # inverted range (date_to before date_from) overlaps nothing
+        other = active[1 - side].get(rng.loose_key)
+        if other:
+            # Ranges that ended before this start can never overlap a later range
+            other[:] = [(oi, o) for oi, o in other if o.end >= start]
+            rng_end = rng.end
+            rng_strict = rng.strict_key
+            for oidx, o in other:
+                # o started no later than rng and is still active, so the
+                # overlap is [start, min(ends)] and is never empty.
+                o_end = o.end
+                ov_end = o_end if o_end < rng_end else rng_end
+
+                # strict match first, loose match as fallback (same bucket => loose keys equal)
+                if o.strict_key == rng_strict:
+                    match_type: MatchType = "strict"
+                    has_strict = True
+                else:
+                    match_type = "loose"
+                if side == 0:
+                    f = (start, _PRIORITY[match_type], ov_end, idx, oidx, rng, o, match_type)
+                else:
+                    f = (start, _PRIORITY[match_type], ov_end, oidx, idx, o, rng, match_type)
+                if materialize_windows:
+                    found.append(f)
+                # (pet_idx, ben_idx) is unique, so tuple order never reaches the range objects
+                if best is None or f < best:
+                    best = f
+        active[side].setdefault(rng.loose_key, []).append((idx, rng))
+
+    # Sort windows by start date, prefer strict when starts are equal;
+    # remaining ties keep petitioner-then-beneficiary input order.
+    found.sort(key=_found_sort_key)  # empty unless materialize_windows
+    windows: List[SharedResidenceWindow] = [
+        SharedResidenceWindow(
+            start=date.fromordinal(ov_start),
+            end=date.fromordinal(ov_end),
+            match_type=match_type,
+            petitioner_entry=pr.entry,
+            beneficiary_entry=br.entry,
+        )
+        for ov_start, _prio, ov_end, _pi, _bi, pr, br, match_type in found
+    ]
+
+    if best is None:
         issues = [
             Issue(
                 severity="medium",
                 category="joint_residency",
                 ref_id="joint_residency",
-                message="No shared residential address overlap was detected between petitioner and beneficiary in the selected window.",
+                message=_NO_OVERLAP_MESSAGE,
                 suggested_question=(
                     f"Have you and your spouse lived together at any point between {window_start} and {window_end}? "
                     "If yes, please provide the shared address and dates. If not, briefly explain your living arrangement."
@@ -188,36 +237,15 @@ def detect_joint_residency_start(
             issues=issues,
         )
 
-    # Sort windows by start date, prefer strict when starts are equal
-    priority = {"strict": 0, "loose": 1}
-    windows.sort(key=lambda w: (w.start, priority[w.match_type], w.end))
-
-    first = windows[0]
-
     issues: List[Issue] = []
 
     # If we have NO strict windows at all, only loose matches exist -> near-match concern
-    has_strict = any(w.match_type == "strict" for w in windows)
     if not has_strict:
-        issues.append(
-            Issue(
-                severity="medium",
-                category="joint_residency",
-                ref_id="joint_residency",
-                message=(
-                    "A possible shared residence was detected, but only via loose address matching "
-                    "(unit/ZIP differences may exist)."
-                ),
-                suggested_question=(
-                    "Please confirm your shared residence address details (unit/apartment and ZIP). "
-                    "If you lived together, which exact address should be used on the forms?"
-                ),
-            )
-        )
+        issues.append(_LOOSE_ONLY_ISSUE)
 
     return JointResidencyResult(
-        first_shared_date=first.start,
-        match_type=first.match_type,
+        first_shared_date=date.fromordinal(best[0]),
+        match_type=best[7],
         windows=windows,
         issues=issues,
     )
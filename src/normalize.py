@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from datetime import date
-from typing import Optional, Literal
+from datetime import MAXYEAR, MINYEAR, date, datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional, Literal, Union
 
 
 DatePrecision = Literal["day", "month", "year", "unknown"]
 
 
-@dataclass(frozen=True)
-class NormalizedDate:
+class NormalizedDate(NamedTuple):
     """
     value:
       - datetime.date when known
@@ -23,26 +22,92 @@ class NormalizedDate:
 
     is_present:
       - True ONLY if the input explicitly meant 'Present'
+
+    A NamedTuple (immutable, cheap to build); read it by attribute.
     """
     value: Optional[date]
     precision: DatePrecision
     is_present: bool = False
 
 
+_UNKNOWN = NormalizedDate(value=None, precision="unknown", is_present=False)
+
+_PRESENT_WORDS = frozenset({"present", "current", "now"})
+
+# -----------------------------
+# Supported formats (compiled once)
+# -----------------------------
+
+# Day precision
+_RE_YMD_DASH = re.compile(r"(\d{4})-(\d{2})-(\d{2})")        # YYYY-MM-DD
+_RE_YMD_SLASH = re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})")   # YYYY/MM/DD
+_RE_MDY_SLASH = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")   # MM/DD/YYYY (US-style)
+
+# Month precision (day = 1st)
+_RE_YM_DASH = re.compile(r"(\d{4})-(\d{2})")                  # YYYY-MM
+_RE_YM_SLASH = re.compile(r"(\d{4})/(\d{1,2})")               # YYYY/MM
+_RE_MY_SLASH = re.compile(r"(\d{1,2})/(\d{4})")               # MM/YYYY
+_RE_MY_DASH = re.compile(r"(\d{1,2})-(\d{4})")                # MM-YYYY
+
+# Year precision (Jan 1)
+_RE_Y = re.compile(r"(\d{4})")                                 # YYYY
+
+# Candidate formats by shape: (number of "-", number of "/"). Every pattern
+# needs exactly its own separators, so only one group can ever match; within
+# a group the order is the original try order, and the first pattern that
+# matches decides the result.
+# (bound fullmatch, precision, (year, month, day) group indices, US-MDY only)
+_DATE_FORMATS_BY_SHAPE = {
+    (2, 0): (
+        (_RE_YMD_DASH.fullmatch, "day", (0, 1, 2), False),
+    ),
+    (0, 2): (
+        (_RE_YMD_SLASH.fullmatch, "day", (0, 1, 2), False),
+        (_RE_MDY_SLASH.fullmatch, "day", (2, 0, 1), True),
+    ),
+    (1, 0): (
+        (_RE_YM_DASH.fullmatch, "month", (0, 1, None), False),
+        (_RE_MY_DASH.fullmatch, "month", (1, 0, None), False),
+    ),
+    (0, 1): (
+        (_RE_YM_SLASH.fullmatch, "month", (0, 1, None), False),
+        (_RE_MY_SLASH.fullmatch, "month", (1, 0, None), False),
+    ),
+    (0, 0): (
+        (_RE_Y.fullmatch, "year", (0, None, None), False),
+    ),
+}
+
+
+# Upper bound of day-of-month per month; Feb 29 is checked against leap years
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def _safe_date(y: int, m: int, d: int) -> Optional[date]:
-    """Return None instead of raising ValueError for invalid dates (e.g., 02/31/2023)."""
-    try:
-        return date(y, m, d)
-    except ValueError:
+    """
+    Return None instead of raising ValueError for invalid dates (e.g., 02/31/2023).
+
+    Validated up front (range table + leap-year rule), so the common valid
+    case builds the date directly with no exception machinery.
+    """
+    if not (MINYEAR <= y <= MAXYEAR and 1 <= m <= 12 and 1 <= d <= _DAYS_IN_MONTH[m - 1]):
+        return None
+    if m == 2 and d == 29 and not (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)):
         return None
+    return date(y, m, d)
 
 
-def normalize_date(text: Optional[str], assume_us_mdy: bool = True) -> NormalizedDate:
+@lru_cache(maxsize=4096)
+def normalize_date(
+    text: Union[str, date, NormalizedDate, None], assume_us_mdy: bool = True
+) -> NormalizedDate:
     """
     Normalize common intake date strings into a comparable date + precision.
 
     Supported inputs:
       - "Present", "Current", "Now" (any capitalization)
+      - an already-normalized value: NormalizedDate (returned as-is) or a
+        date / datetime (day precision, time dropped)
 
       Day precision:
       - "YYYY-MM-DD"
@@ -64,121 +129,62 @@ def normalize_date(text: Optional[str], assume_us_mdy: bool = True) -> Normalize
       - Precision is tracked separately (critical for gap detection)
       - Invalid dates NEVER crash the program
       - Unrecognized formats return precision="unknown"
+      - Memoized on (text, assume_us_mdy): it is pure and NormalizedDate is
+        frozen, so repeated intake strings ("Present", "2022-01") are parsed once
     """
     if text is None:
-        return NormalizedDate(value=None, precision="unknown", is_present=False)
+        return _UNKNOWN
+
+    # Pass-through for callers that normalized upstream
+    if isinstance(text, NormalizedDate):
+        return text
+    if isinstance(text, date):
+        if isinstance(text, datetime):
+            text = text.date()
+        return NormalizedDate(value=text, precision="day", is_present=False)
 
     s = text.strip()
     if not s:
-        return NormalizedDate(value=None, precision="unknown", is_present=False)
+        return _UNKNOWN
 
-    s_lower = s.lower()
-    if s_lower in {"present", "current", "now"}:
+    if s.lower() in _PRESENT_WORDS:
         # "Present" behaves like an open-ended date; caller decides what "today" is.
         return NormalizedDate(value=None, precision="day", is_present=True)
 
-    # -----------------------------
-    # Day precision formats
-    # -----------------------------
-
-    # YYYY-MM-DD
-    m = re.fullmatch(r"(\d{4})-(\d{2})-(\d{2})", s)
-    if m:
-        y, mo, d = map(int, m.groups())
-        dt = _safe_date(y, mo, d)
-        return (
-            NormalizedDate(value=dt, precision="day", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # YYYY/MM/DD  (added)
-    m = re.fullmatch(r"(\d{4})/(\d{1,2})/(\d{1,2})", s)
-    if m:
-        y, mo, d = map(int, m.groups())
-        dt = _safe_date(y, mo, d)
-        return (
-            NormalizedDate(value=dt, precision="day", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # MM/DD/YYYY (US-style, because questionnaire specifies this format)
-    if assume_us_mdy:
-        m = re.fullmatch(r"(\d{1,2})/(\d{1,2})/(\d{4})", s)
+    # Fixed-width ASCII forms ("YYYY-MM-DD", "YYYY-MM", "YYYY") are parsed by
+    # slicing, without a regex. Anything else, including non-ASCII digits that
+    # \d also accepts, goes through the patterns below.
+    n = len(s)
+    if s.isascii():
+        if n == 10 and s[4] == "-" and s[7] == "-" and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit():
+            dt = _safe_date(int(s[:4]), int(s[5:7]), int(s[8:]))
+            return NormalizedDate(value=dt, precision="day", is_present=False) if dt else _UNKNOWN
+        if n == 7 and s[4] == "-" and s[:4].isdigit() and s[5:].isdigit():
+            dt = _safe_date(int(s[:4]), int(s[5:]), 1)
+            return NormalizedDate(value=dt, precision="month", is_present=False) if dt else _UNKNOWN
+        if n == 4 and s.isdigit():
+            dt = _safe_date(int(s), 1, 1)
+            return NormalizedDate(value=dt, precision="year", is_present=False) if dt else _UNKNOWN
+
+    shape = (s.count("-"), s.count("/"))
+    for fullmatch, precision, (yi, mi, di), us_mdy_only in _DATE_FORMATS_BY_SHAPE.get(shape, ()):
+        if us_mdy_only and not assume_us_mdy:
+            continue
+        m = fullmatch(s)
         if m:
-            mo, d, y = map(int, m.groups())
-            dt = _safe_date(y, mo, d)
+            g = m.groups()
+            dt = _safe_date(
+                int(g[yi]),
+                int(g[mi]) if mi is not None else 1,
+                int(g[di]) if di is not None else 1,
+            )
             return (
-                NormalizedDate(value=dt, precision="day", is_present=False)
+                NormalizedDate(value=dt, precision=precision, is_present=False)
                 if dt
-                else NormalizedDate(value=None, precision="unknown", is_present=False)
+                else _UNKNOWN
             )
 
-    # -----------------------------
-    # Month precision formats
-    # -----------------------------
-
-    # YYYY-MM
-    m = re.fullmatch(r"(\d{4})-(\d{2})", s)
-    if m:
-        y, mo = map(int, m.groups())
-        dt = _safe_date(y, mo, 1)
-        return (
-            NormalizedDate(value=dt, precision="month", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # YYYY/MM  (added)
-    m = re.fullmatch(r"(\d{4})/(\d{1,2})", s)
-    if m:
-        y, mo = map(int, m.groups())
-        dt = _safe_date(y, mo, 1)
-        return (
-            NormalizedDate(value=dt, precision="month", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # MM/YYYY
-    m = re.fullmatch(r"(\d{1,2})/(\d{4})", s)
-    if m:
-        mo, y = map(int, m.groups())
-        dt = _safe_date(y, mo, 1)
-        return (
-            NormalizedDate(value=dt, precision="month", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # MM-YYYY  (added)
-    m = re.fullmatch(r"(\d{1,2})-(\d{4})", s)
-    if m:
-        mo, y = map(int, m.groups())
-        dt = _safe_date(y, mo, 1)
-        return (
-            NormalizedDate(value=dt, precision="month", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    # -----------------------------
-    # Year precision format
-    # -----------------------------
-
-    # YYYY
-    m = re.fullmatch(r"(\d{4})", s)
-    if m:
-        y = int(m.group(1))
-        dt = _safe_date(y, 1, 1)
-        return (
-            NormalizedDate(value=dt, precision="year", is_present=False)
-            if dt
-            else NormalizedDate(value=None, precision="unknown", is_present=False)
-        )
-
-    return NormalizedDate(value=None, precision="unknown", is_present=False)
+    return _UNKNOWN
 
 
 def end_date_or_today(nd: NormalizedDate, today: Optional[date] = None) -> Optional[date]:
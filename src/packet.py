@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import copy
+from collections import defaultdict
 from datetime import date
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
@@ -13,140 +14,185 @@ from .glue import RawSnapshot
 
 Severity = Literal["high", "medium", "low"]
 
+# Severity priority order for the packet summary top items
+_SEVERITY_ORDER: Tuple[Severity, ...] = ("high", "medium", "low")
+
 
 def _iso(d: Optional[date]) -> Optional[str]:
     return d.isoformat() if d else None
 
 
-def _snapshot_index(snapshots: List[RawSnapshot]) -> Dict[str, RawSnapshot]:
-    return {s.id: s for s in snapshots}
+# Unbound date.isoformat for the per-row _format_* helpers, which inline _iso
+# (no extra call frame or method lookup per date field)
+_ISO = date.isoformat
+
 
+_IMMUTABLE_SCALARS = (str, int, float, bool, type(None))
 
-def _issue_to_dict(issue: Issue, snapshot_by_id: Dict[str, RawSnapshot]) -> Dict[str, Any]:
-    ref_id = issue.ref_id
-    snap = snapshot_by_id.get(ref_id) if ref_id else None
 
+def _copy_raw(v: Any) -> Any:
+    """
+    Copy raw intake data (JSON-shaped) the way dataclasses.asdict would:
+    fresh dicts/lists all the way down, scalars shared, anything else deep-copied.
+    """
+    t = type(v)
+    if t is dict:
+        return {_copy_raw(k): _copy_raw(x) for k, x in v.items()}
+    if t is list:
+        return [_copy_raw(x) for x in v]
+    if t in _IMMUTABLE_SCALARS:
+        return v
+    return copy.deepcopy(v)
+
+
+def _snapshot_to_dict(s: RawSnapshot) -> Dict[str, Any]:
+    # Field-by-field equivalent of asdict(s) without its per-call field reflection
+    return {
+        "id": s.id,
+        "section": s.section,
+        "raw": _copy_raw(s.raw),
+        "notes": s.notes,
+    }
+
+
+def _snapshot_index(snapshots: List[RawSnapshot], snapshot_dicts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """id -> already-converted snapshot dict (last wins on duplicate ids)."""
+    return {s.id: d for s, d in zip(snapshots, snapshot_dicts)}
+
+
+def _issue_to_dict(issue: Issue, snap: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     return {
         "severity": issue.severity,
         "category": issue.category,
-        "ref_id": ref_id,
+        "ref_id": issue.ref_id,
         "message": issue.message,
         "suggested_question": issue.suggested_question,
-        "raw_snapshot": asdict(snap) if snap else None,
+        "raw_snapshot": snap,
     }
 
 
-def _format_address_entry(e) -> Dict[str, Any]:
-    a = e.address
+def _addr_to_dict(a) -> Dict[str, Any]:
     return {
-        "address": {
-            "street_name": a.street_name,
-            "unit_type": a.unit_type,
-            "unit_number": a.unit_number,
-            "city": a.city,
-            "state_province": a.state_province,
-            "zip_code": a.zip_code,
-            "country": a.country,
-        },
-        "date_from": _iso(e.date_from),
+        "street_name": a.street_name,
+        "unit_type": a.unit_type,
+        "unit_number": a.unit_number,
+        "city": a.city,
+        "state_province": a.state_province,
+        "zip_code": a.zip_code,
+        "country": a.country,
+    }
+
+
+def _cached_addr_dict(a, addr_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    _addr_to_dict memoized per packet build by id(a): the same PostalAddress is
+    cited by its entry and by every joint-residency window. The addresses
+    outlive the build and the output is read-only, so sharing the dict is safe.
+    """
+    d = addr_cache.get(id(a))
+    if d is None:
+        d = addr_cache[id(a)] = _addr_to_dict(a)
+    return d
+
+
+def _format_address_entry(e, addr_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    date_from, date_to = e.date_from, e.date_to
+    return {
+        "address": _cached_addr_dict(e.address, addr_cache),
+        "date_from": _ISO(date_from) if date_from else None,
         "from_precision": e.from_precision,
-        "date_to": _iso(e.date_to),  # None means Present
+        "date_to": _ISO(date_to) if date_to else None,  # None means Present
         "to_precision": e.to_precision,
         "address_type": e.address_type,
         "notes": e.notes,
     }
 
 
-def _format_employment_entry(e) -> Dict[str, Any]:
+def _format_employment_entry(e, addr_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
     addr = None
     if e.employer_address is not None:
-        a = e.employer_address
-        addr = {
-            "street_name": a.street_name,
-            "unit_type": a.unit_type,
-            "unit_number": a.unit_number,
-            "city": a.city,
-            "state_province": a.state_province,
-            "zip_code": a.zip_code,
-            "country": a.country,
-        }
+        addr = _cached_addr_dict(e.employer_address, addr_cache)
 
+    date_from, date_to = e.date_from, e.date_to
     return {
         "employer": e.employer,
         "role": e.role,
         "employer_address": addr,
-        "date_from": _iso(e.date_from),
-        "date_to": _iso(e.date_to),  # None means Present
+        "date_from": _ISO(date_from) if date_from else None,
+        "date_to": _ISO(date_to) if date_to else None,  # None means Present
         "employment_type": e.employment_type,
         "notes": e.notes,
     }
 
 
 def _format_travel_entry(e) -> Dict[str, Any]:
+    d = e.date
     return {
         "event_type": e.event_type,
-        "date": _iso(e.date),
+        "date": _ISO(d) if d else None,
         "port_or_city": e.port_or_city,
         "status_or_class": e.status_or_class,
         "notes": e.notes,
     }
 
 
-def _group_issues(issues: List[Issue]) -> Dict[Severity, List[Issue]]:
-    grouped: Dict[Severity, List[Issue]] = {"high": [], "medium": [], "low": []}
-    for i in issues:
-        grouped[i.severity].append(i)
-    return grouped
-
-
-def _group_issues_by_ref(issues: List[Issue]) -> Dict[str, List[Issue]]:
-    by_ref: Dict[str, List[Issue]] = {}
-    for i in issues:
-        key = i.ref_id or "unlinked"
-        by_ref.setdefault(key, []).append(i)
-    return by_ref
+def _partition_issues(
+    issues: List[Issue],
+    snapshots: List[RawSnapshot],
+    snapshot_dicts: List[Dict[str, Any]],
+    n_top: int = 3,
+) -> Tuple[
+    Dict[Severity, List[Dict[str, Any]]],
+    Dict[str, List[Dict[str, Any]]],
+    Dict[str, List[Dict[str, Any]]],
+    List[Dict[str, Any]],
+]:
+    """
+    One pass over issues -> (by_severity, by_category, by_ref_id, top_n) of issue dicts.
 
-def _group_issues_by_category(issues: List[Issue]) -> Dict[str, List[Issue]]:
-    by_cat: Dict[str, List[Issue]] = {}
+    Each issue is converted once; the three groupings share that dict.
+    The snapshot index is only built once an issue actually has a ref_id.
+    top_n prioritizes high > medium > low, then keeps original order: that is
+    exactly the severity groups concatenated, so it needs no sort.
+    """
+    by_sev: Dict[Severity, List[Dict[str, Any]]] = {"high": [], "medium": [], "low": []}
+    by_cat: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    by_ref: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    snap_by_id: Optional[Dict[str, Dict[str, Any]]] = None
     for i in issues:
-        by_cat.setdefault(i.category, []).append(i)
-    return by_cat
-
-
-def _top_issues(issues: List[Issue], n: int = 3) -> List[Issue]:
-    # Prioritize high > medium > low, then keep original order
-    priority = {"high": 0, "medium": 1, "low": 2}
-    return sorted(issues, key=lambda x: priority.get(x.severity, 9))[:n]
-
-def _format_joint_residency_window(w) -> Dict[str, Any]:
+        ref_id = i.ref_id
+        snap = None
+        if ref_id:
+            if snap_by_id is None:
+                snap_by_id = _snapshot_index(snapshots, snapshot_dicts)
+            snap = snap_by_id.get(ref_id)
+        d = _issue_to_dict(i, snap)
+        by_sev[i.severity].append(d)
+        by_cat[i.category].append(d)
+        by_ref[ref_id or "unlinked"].append(d)
+
+    top: List[Dict[str, Any]] = []
+    for sev in _SEVERITY_ORDER:
+        top.extend(by_sev[sev][: n_top - len(top)])
+    # plain dicts in the packet (no auto-vivifying lookups for consumers)
+    return by_sev, dict(by_cat), dict(by_ref), top
+
+
+def _format_joint_residency_window(w, addr_cache: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    start, end = w.start, w.end
     return {
-        "start": _iso(w.start),
-        "end": _iso(w.end),
+        "start": _ISO(start) if start else None,
+        "end": _ISO(end) if end else None,
         "match_type": w.match_type,
-        "petitioner_address": {
-            "street_name": w.petitioner_entry.address.street_name,
-            "unit_type": w.petitioner_entry.address.unit_type,
-            "unit_number": w.petitioner_entry.address.unit_number,
-            "city": w.petitioner_entry.address.city,
-            "state_province": w.petitioner_entry.address.state_province,
-            "zip_code": w.petitioner_entry.address.zip_code,
-            "country": w.petitioner_entry.address.country,
-        },
-        "beneficiary_address": {
-            "street_name": w.beneficiary_entry.address.street_name,
-            "unit_type": w.beneficiary_entry.address.unit_type,
-            "unit_number": w.beneficiary_entry.address.unit_number,
-            "city": w.beneficiary_entry.address.city,
-            "state_province": w.beneficiary_entry.address.state_province,
-            "zip_code": w.beneficiary_entry.address.zip_code,
-            "country": w.beneficiary_entry.address.country,
-        },
+        "petitioner_address": _cached_addr_dict(w.petitioner_entry.address, addr_cache),
+        "beneficiary_address": _cached_addr_dict(w.beneficiary_entry.address, addr_cache),
     }
 
 def _format_travel_interval(i) -> Dict[str, Any]:
+    exit_date, entry_date = i.exit_date, i.entry_date
     return {
-        "exit_date": _iso(i.exit_date),
-        "entry_date": _iso(i.entry_date),
+        "exit_date": _ISO(exit_date) if exit_date else None,
+        "entry_date": _ISO(entry_date) if entry_date else None,
         "days_abroad": i.days_abroad,
         "is_brief": i.is_brief,
     }
@@ -165,11 +211,14 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
 
     No new validation is performed here.
     """
-    snap_by_id = _snapshot_index(result.snapshots)
+    # Each snapshot is converted once and shared by raw_snapshots and the issues citing it
+    snapshot_dicts = [_snapshot_to_dict(s) for s in result.snapshots]
 
-    grouped_by_sev = _group_issues(result.issues)
-    grouped_by_cat = _group_issues_by_category(result.issues)
-    top = _top_issues(result.issues, n=3)
+    grouped_by_sev, grouped_by_cat, grouped_by_ref, top = _partition_issues(
+        result.issues, result.snapshots, snapshot_dicts, n_top=3
+    )
+
+    addr_cache: Dict[int, Dict[str, Any]] = {}
 
     # Timelines
     beneficiary = result.case.beneficiary
@@ -190,13 +239,13 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
         },
         "timelines": {
             "beneficiary": {
-                "addresses_lived": [_format_address_entry(e) for e in beneficiary.addresses_lived],
-                "employment": [_format_employment_entry(e) for e in beneficiary.employment],
+                "addresses_lived": [_format_address_entry(e, addr_cache) for e in beneficiary.addresses_lived],
+                "employment": [_format_employment_entry(e, addr_cache) for e in beneficiary.employment],
                 "travel": [_format_travel_entry(e) for e in beneficiary.travel_entries],
             },
             "petitioner": {
-                "addresses_lived": [_format_address_entry(e) for e in petitioner.addresses_lived],
-                "employment": [_format_employment_entry(e) for e in petitioner.employment],
+                "addresses_lived": [_format_address_entry(e, addr_cache) for e in petitioner.addresses_lived],
+                "employment": [_format_employment_entry(e, addr_cache) for e in petitioner.employment],
                 "travel": [_format_travel_entry(e) for e in petitioner.travel_entries],
             },
         },
@@ -204,7 +253,7 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
             "first_shared_date": _iso(result.joint_residency.first_shared_date),
             "match_type": result.joint_residency.match_type,
             "windows": [
-                _format_joint_residency_window(w)
+                _format_joint_residency_window(w, addr_cache)
                 for w in result.joint_residency.windows
             ],
         },
@@ -218,13 +267,13 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
                 },
                 "top_items": [
                     {
-                        "severity": i.severity,
-                        "category": i.category,
-                        "ref_id": i.ref_id,
-                        "message": i.message,
-                        "suggested_question": i.suggested_question,
+                        "severity": d["severity"],
+                        "category": d["category"],
+                        "ref_id": d["ref_id"],
+                        "message": d["message"],
+                        "suggested_question": d["suggested_question"],
                     }
-                    for i in top
+                    for d in top
                 ],
             },
             "counts": {
@@ -233,19 +282,9 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
                 "low": len(grouped_by_sev["low"]),
                 "total": len(result.issues),
             },
-            "by_severity": {
-                "high": [_issue_to_dict(i, snap_by_id) for i in grouped_by_sev["high"]],
-                "medium": [_issue_to_dict(i, snap_by_id) for i in grouped_by_sev["medium"]],
-                "low": [_issue_to_dict(i, snap_by_id) for i in grouped_by_sev["low"]],
-            },
-            "by_category": {
-                cat: [_issue_to_dict(i, snap_by_id) for i in cat_issues]
-                for cat, cat_issues in grouped_by_cat.items()
-            },
-            "by_ref_id": {
-                ref_id: [_issue_to_dict(i, snap_by_id) for i in issues_for_ref]
-                for ref_id, issues_for_ref in _group_issues_by_ref(result.issues).items()
-            },
+            "by_severity": grouped_by_sev,
+            "by_category": grouped_by_cat,
+            "by_ref_id": grouped_by_ref,
         },
         "travel_analysis": {
             "beneficiary": {
@@ -262,7 +301,7 @@ def build_attorney_review_packet(result: BuildResult) -> Dict[str, Any]:
             },
         },
         # Optional: include snapshots as a flat list too (useful for UI/debug)
-        "raw_snapshots": [asdict(s) for s in result.snapshots],
+        "raw_snapshots": snapshot_dicts,
     }
 
     return packet
@@ -4,15 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from .issues import tag_issues
 from .joint_residency import detect_joint_residency_start, JointResidencyResult
 from .validate import (
     Issue,
-    detect_address_gaps,
-    detect_address_overlaps,
-    detect_employment_gaps,
-    detect_employment_overlaps,   # ✅ ADD
+    detect_address_history,
+    detect_employment_history,
 )
 
 
@@ -24,11 +23,6 @@ from .glue import (
     require_date,
 )
 from .models import ImmigrationCase, PersonData
-from .validate import (
-    Issue,
-    detect_address_gaps,
-    detect_address_overlaps,
-)
 from .travel_intelligence import analyze_travel, TravelAnalysisResult
 
 
@@ -44,6 +38,15 @@ class BuildResult:
     travel_petitioner: TravelAnalysisResult
 
 
+# Shared read-only stand-ins for missing raw sections (only iterated / .get()-ed),
+# so absent or null sections do not allocate a fresh [] / {} per call
+_EMPTY: Tuple[Any, ...] = ()
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Width of the validation window (see _compute_last_5_year_window), built once
+_FIVE_YEARS = timedelta(days=5 * 365)
+
+
 def _compute_last_5_year_window(today: Optional[date] = None) -> Tuple[date, date]:
     """
     Compute a naive 'last 5 years' window.
@@ -51,60 +54,55 @@ def _compute_last_5_year_window(today: Optional[date] = None) -> Tuple[date, dat
     Later: use relativedelta(years=5) for exact calendar logic.
     """
     end = today or date.today()
-    start = end - timedelta(days=5 * 365)
+    start = end - _FIVE_YEARS
     return start, end
 
 
+# Address sort tie-break on equal date_from: coarser precision first
+_FROM_PRECISION_RANK = {"year": 0, "month": 1, "day": 2}
+
+
 def _build_person(
     raw_person: Dict[str, Any],
     *,
     prefix: str,
     assume_us_mdy: bool,
-    issues: List[Issue],
-    snapshots: List[RawSnapshot],
-) -> PersonData:
+) -> Tuple[PersonData, List[Issue], List[RawSnapshot]]:
     """
     Build a PersonData from a raw dict using glue parsers.
     We do NOT do names/identifiers here yet (MVP focuses on timelines).
+
+    Returns (person, issues, snapshots); issues/snapshots are in
+    addresses -> employment -> travel order.
     """
     # Addresses
-    raw_addresses = raw_person.get("addresses", []) or []
+    raw_addresses = raw_person.get("addresses") or _EMPTY
     addr_entries, addr_issues, addr_snaps = parse_address_list(
         raw_addresses, assume_us_mdy=assume_us_mdy, id_prefix=f"{prefix}_addr"
     )
-    issues.extend(addr_issues)
-    snapshots.extend(addr_snaps)
 
     # Employment
-    raw_employment = raw_person.get("employment", []) or []
+    raw_employment = raw_person.get("employment") or _EMPTY
     emp_entries, emp_issues, emp_snaps = parse_employment_list(
         raw_employment, assume_us_mdy=assume_us_mdy, id_prefix=f"{prefix}_emp"
     )
-    issues.extend(emp_issues)
-    snapshots.extend(emp_snaps)
 
     # Travel
-    raw_travel = raw_person.get("travel", []) or []
+    raw_travel = raw_person.get("travel") or _EMPTY
     trv_entries, trv_issues, trv_snaps = parse_travel_list(
         raw_travel, assume_us_mdy=assume_us_mdy, id_prefix=f"{prefix}_trv"
     )
-    issues.extend(trv_issues)
-    snapshots.extend(trv_snaps)
 
-    addr_entries.sort(
-        key=lambda x: (
-            x.date_from,
-            {"year": 0, "month": 1, "day": 2}.get(x.from_precision, 3),
-        )
-    )
+    addr_entries.sort(key=lambda x: (x.date_from, _FROM_PRECISION_RANK.get(x.from_precision, 3)))
     emp_entries.sort(key=lambda x: x.date_from)
     trv_entries.sort(key=lambda x: x.date)
 
-    return PersonData(
+    person = PersonData(
         addresses_lived=addr_entries,
         employment=emp_entries,
         travel_entries=trv_entries,
     )
+    return person, [*addr_issues, *emp_issues, *trv_issues], [*addr_snaps, *emp_snaps, *trv_snaps]
 
 def load_case_from_json(
     raw: Dict[str, Any],
@@ -124,21 +122,17 @@ def load_case_from_json(
       - MVP focuses on address/employment/travel timelines and marriage date.
       - Later we’ll add parsing for names, identifiers, current addresses, etc.
     """
-    issues: List[Issue] = []
-    snapshots: List[RawSnapshot] = []
+    raw_pet = raw.get("petitioner") or _EMPTY_MAPPING
+    raw_ben = raw.get("beneficiary") or _EMPTY_MAPPING
 
-    raw_pet = raw.get("petitioner", {}) or {}
-    raw_ben = raw.get("beneficiary", {}) or {}
+    petitioner, pet_issues, pet_snaps = _build_person(raw_pet, prefix="pet", assume_us_mdy=assume_us_mdy)
+    beneficiary, ben_issues, ben_snaps = _build_person(raw_ben, prefix="ben", assume_us_mdy=assume_us_mdy)
 
-    petitioner = _build_person(
-        raw_pet, prefix="pet", assume_us_mdy=assume_us_mdy, issues=issues, snapshots=snapshots
-    )
-    beneficiary = _build_person(
-        raw_ben, prefix="ben", assume_us_mdy=assume_us_mdy, issues=issues, snapshots=snapshots
-    )
+    issues: List[Issue] = [*pet_issues, *ben_issues]
+    snapshots: List[RawSnapshot] = [*pet_snaps, *ben_snaps]
 
     # Marriage block (optional)
-    marriage = raw.get("marriage", {}) or {}
+    marriage = raw.get("marriage") or _EMPTY_MAPPING
     marriage_date_value, _prec, is_present, m_issues = require_date(
         field_label="marriage date",
         raw_text=marriage.get("date"),
@@ -165,90 +159,41 @@ def load_case_from_json(
     # Compute window (last 5 years, MVP)
     window_start, window_end = _compute_last_5_year_window(today=today)
 
-    # Run validators on beneficiary by default (typical for AOS continuity questions)
-    issues.extend(
-        tag_issues(
-            detect_address_gaps(
-                case.beneficiary.addresses_lived,
-                window_start=window_start,
-                window_end=window_end,
-            ),
-            "ben_address_history",
-        )
-    )
-    issues.extend(
-        tag_issues(
-            detect_address_overlaps(
-                case.beneficiary.addresses_lived,
-                window_start=window_start,
-            window_end=window_end,
-            ),
-            "ben_address_history",
-        )
-    )
-    issues.extend(
-        tag_issues(
-            detect_employment_gaps(
-                case.beneficiary.employment,
-                window_start=window_start,
-                window_end=window_end,
-            ),
-            "ben_employment_history",
-        )
+    # Run validators on beneficiary by default (typical for AOS continuity questions).
+    # Each *_history call builds and sweeps the ranges once for both gaps and overlaps.
+    gaps, overlaps = detect_address_history(
+        case.beneficiary.addresses_lived,
+        window_start=window_start,
+        window_end=window_end,
     )
-    issues.extend(
-        tag_issues(
-            detect_employment_overlaps(
-                case.beneficiary.employment,
-                window_start=window_start,
-                window_end=window_end,
-            ),
-            "ben_employment_history",
-        )
+    issues.extend(tag_issues(gaps, "ben_address_history"))
+    issues.extend(tag_issues(overlaps, "ben_address_history"))
+
+    gaps, overlaps = detect_employment_history(
+        case.beneficiary.employment,
+        window_start=window_start,
+        window_end=window_end,
     )
+    issues.extend(tag_issues(gaps, "ben_employment_history"))
+    issues.extend(tag_issues(overlaps, "ben_employment_history"))
 
     # Optional: validate petitioner too
     if validate_petitioner:
-        issues.extend(
-            tag_issues(
-                detect_address_gaps(
-                    case.petitioner.addresses_lived,
-                    window_start=window_start,
-                    window_end=window_end,
-                ),
-                "pet_address_history",
-            )
-        )
-        issues.extend(
-            tag_issues(
-                detect_address_overlaps(
-                    case.petitioner.addresses_lived,
-                    window_start=window_start,
-                    window_end=window_end,
-                ),
-                "pet_address_history",
-            )
-        )
-        issues.extend(
-            tag_issues(
-                detect_employment_gaps(
-                    case.petitioner.employment,
-                    window_start=window_start,
-                    window_end=window_end,
-                ),
-                "pet_employment_history",
-            )
+        gaps, overlaps = detect_address_history(
+            case.petitioner.addresses_lived,
+            window_start=window_start,
+            window_end=window_end,
         )
-        issues.extend(
-            tag_issues(
-                detect_employment_overlaps(
-                    case.petitioner.employment,
-                    window_start=window_start,
-                    window_end=window_end,
-                ),
-                "pet_employment_history",
-            )
+        issues.extend(tag_issues(gaps, "pet_address_history"))
+        issues.extend(tag_issues(overlaps, "pet_address_history"))
+
+        gaps, overlaps = detect_employment_history(
+            case.petitioner.employment,
+            window_start=window_start,
+            window_end=window_end,
         )
+        issues.extend(tag_issues(gaps, "pet_employment_history"))
+        issues.extend(tag_issues(overlaps, "pet_employment_history"))
 
     jr = detect_joint_residency_start(
         case,
@@ -0,0 +1,75 @@
+# src/smoke_fixtures.py
+"""
+Shared input case for the pipeline/packet smoke tests.
+
+The case is serialized once at import; fresh_case() parses a new, independent
+copy (one C-level json.loads) instead of each script carrying its own literal.
+"""
+
+import json
+from datetime import date
+from typing import Any, Dict
+
+
+# Use a fixed "today" so results are deterministic
+SMOKE_TODAY = date(2025, 12, 29)
+
+_RAW_CASE_JSON = json.dumps({
+    "beneficiary": {
+        "addresses": [
+            {
+                "street_name": "111 First St",
+                "city": "Charlotte",
+                "state_province": "North Carolina",  # warns (US code)
+                "zip_code": "28209",
+                "country": "USA",
+                "date_from": "06/2022",
+                "date_to": "07/2022",
+                "address_type": "lived",
+            },
+            {
+                "street_name": "222 Second St",
+                "city": "Charlotte",
+                "state_province": "NC",
+                "zip_code": "28209",
+                "country": "USA",
+                "date_from": "2022-02-31",  # invalid -> high issue
+                "date_to": "Present",
+                "address_type": "lived",
+            },
+        ],
+        "employment": [
+            {
+                "employer": "Vexa Consulting",
+                "role": "Analyst",
+                "date_from": "08/2025",
+                "date_to": "Present",
+                "employment_type": "self_employed",
+            }
+        ],
+        "travel": [
+            {
+                "event_type": "entry",
+                "date": "07/15/2023",
+                "port_or_city": "JFK",
+                "status_or_class": "B2",
+            }
+        ],
+    },
+    "petitioner": {
+        "addresses": [],
+        "employment": [],
+        "travel": [],
+    },
+    "marriage": {
+        "date": "06/15/2025",
+        "city": "Charlotte",
+        "state": "NC",
+        "country": "USA",
+    },
+}).encode()
+
+
+def fresh_case() -> Dict[str, Any]:
+    """A new copy of the smoke-test raw case (safe to mutate)."""
+    return json.loads(_RAW_CASE_JSON)
@@ -4,7 +4,7 @@ from src.canonicalize import address_keys, compare_addresses
 from src.models import PostalAddress
 
 
-def main():
+def test_canonicalize_examples():
     # Same underlying place, different formatting
     a = PostalAddress(
         street_name="1518 Asterwind Dr.",
@@ -58,4 +58,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    test_canonicalize_examples()
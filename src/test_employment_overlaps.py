@@ -1,6 +1,6 @@
 from datetime import date
 from src.models import EmploymentEntry
-from src.validate import detect_employment_overlaps
+from src.validate import detect_employment_gaps, detect_employment_history, detect_employment_overlaps
 
 
 def test_employment_overlap_one_day_is_low():
@@ -84,3 +84,40 @@ def test_employment_overlap_with_month_precision_detects_overlap():
 
     issues = detect_employment_overlaps(emp, window_start=window_start, window_end=window_end)
     assert len(issues) == 1
+
+
+def test_employment_history_matches_separate_detectors():
+    window_start = date(2020, 1, 1)
+    window_end = date(2020, 12, 31)
+
+    emp = [
+        EmploymentEntry(
+            employer="A",
+            date_from=date(2020, 2, 1),
+            from_precision="day",
+            date_to=date(2020, 6, 30),
+            to_precision="day",
+            employment_type="employed",
+        ),
+        EmploymentEntry(
+            employer="B",
+            date_from=date(2020, 6, 1),  # overlaps A for June
+            from_precision="day",
+            date_to=date(2020, 8, 31),
+            to_precision="day",
+            employment_type="employed",
+        ),
+        EmploymentEntry(
+            employer="C",
+            date_from=date(2020, 10, 1),  # gap in September
+            from_precision="month",
+            date_to=None,
+            employment_type="self_employed",
+        ),
+    ]
+
+    gaps, overlaps = detect_employment_history(emp, window_start=window_start, window_end=window_end)
+    assert gaps == detect_employment_gaps(emp, window_start=window_start, window_end=window_end)
+    assert overlaps == detect_employment_overlaps(emp, window_start=window_start, window_end=window_end)
+    assert len(gaps) == 2  # January (start of window) and September
+    assert len(overlaps) == 1
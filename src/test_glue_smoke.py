@@ -1,19 +1,26 @@
+import sys
+
 from src.glue import parse_address_list, parse_employment_list, parse_travel_list
 
 
+def emit(lines):
+    # One buffered write per block instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_issues(title: str, issues):
-    print(f"\n=== {title} ===")
+    lines = [f"\n=== {title} ==="]
     if not issues:
-        print("✅ No issues")
-        return
+        lines.append("✅ No issues")
     for i in issues:
         # Issue now has ref_id
-        print(f"[{i.severity}] ({i.category}) ref_id={i.ref_id} :: {i.message}")
+        lines.append(f"[{i.severity}] ({i.category}) ref_id={i.ref_id} :: {i.message}")
         if i.suggested_question:
-            print("  Q:", i.suggested_question)
+            lines.append("  Q: " + i.suggested_question)
+    emit(lines)
 
 
-def main():
+def test_glue_smoke():
     # ----------------------------
     # Addresses
     # ----------------------------
@@ -42,14 +49,15 @@ def main():
 
     addr_entries, addr_issues, addr_snaps = parse_address_list(raw_addresses)
 
-    print("\n=== Parsed Address Entries ===")
+    lines = ["\n=== Parsed Address Entries ==="]
     for e in addr_entries:
-        print(f"- {e.address.street_name}, {e.address.city}, {e.address.state_province} | "
-              f"{e.date_from} ({e.from_precision}) -> {e.date_to} ({e.to_precision})")
+        lines.append(f"- {e.address.street_name}, {e.address.city}, {e.address.state_province} | "
+                     f"{e.date_from} ({e.from_precision}) -> {e.date_to} ({e.to_precision})")
 
-    print("\n=== Address Snapshots ===")
+    lines.append("\n=== Address Snapshots ===")
     for s in addr_snaps:
-        print(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw.keys())}")
+        lines.append(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw)}")
+    emit(lines)
 
     print_issues("Address Issues (expect ref_id=addr_0 and addr_1)", addr_issues)
 
@@ -74,13 +82,14 @@ def main():
 
     emp_entries, emp_issues, emp_snaps = parse_employment_list(raw_employment)
 
-    print("\n=== Parsed Employment Entries ===")
+    lines = ["\n=== Parsed Employment Entries ==="]
     for e in emp_entries:
-        print(f"- {e.employer} | {e.date_from} -> {e.date_to} | {e.employment_type}")
+        lines.append(f"- {e.employer} | {e.date_from} -> {e.date_to} | {e.employment_type}")
 
-    print("\n=== Employment Snapshots ===")
+    lines.append("\n=== Employment Snapshots ===")
     for s in emp_snaps:
-        print(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw.keys())}")
+        lines.append(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw)}")
+    emit(lines)
 
     print_issues("Employment Issues (expect ref_id=emp_1)", emp_issues)
 
@@ -103,16 +112,17 @@ def main():
 
     trv_entries, trv_issues, trv_snaps = parse_travel_list(raw_travel)
 
-    print("\n=== Parsed Travel Entries ===")
+    lines = ["\n=== Parsed Travel Entries ==="]
     for e in trv_entries:
-        print(f"- {e.event_type} on {e.date} | {e.port_or_city} | {e.status_or_class}")
+        lines.append(f"- {e.event_type} on {e.date} | {e.port_or_city} | {e.status_or_class}")
 
-    print("\n=== Travel Snapshots ===")
+    lines.append("\n=== Travel Snapshots ===")
     for s in trv_snaps:
-        print(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw.keys())}")
+        lines.append(f"- snapshot_id={s.id}, section={s.section}, raw_keys={list(s.raw)}")
+    emit(lines)
 
     print_issues("Travel Issues (expect ref_id=trv_1)", trv_issues)
 
 
 if __name__ == "__main__":
-    main()
+    test_glue_smoke()
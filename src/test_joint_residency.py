@@ -20,7 +20,7 @@ def addr(
     unit_type=None,
     unit_number=None,
 ) -> PostalAddress:
-    return PostalAddress(
+    return PostalAddress.model_construct(
         street_name=street,
         unit_type=unit_type,
         unit_number=unit_number,
@@ -31,7 +31,20 @@ def addr(
     )
 
 
-def main():
+# Shared fixtures: the tests below only vary street/unit and dates, so they
+# derive from these with model_copy(update=...) (no re-validation of the rest)
+_BASE_ADDR = addr("1518 Asterwind Dr", unit_type="Apt", unit_number="2A")
+_BASE_ENTRY = AddressEntry.model_construct(
+    address=_BASE_ADDR,
+    date_from=date(2022, 6, 1),
+    from_precision="day",
+    date_to=date(2022, 9, 30),
+    to_precision="day",
+    address_type="lived",
+)
+
+
+def test_joint_residency_scenarios():
     window_start = date(2022, 1, 1)
     window_end = date(2022, 12, 31)
 
@@ -40,31 +53,10 @@ def main():
     # Same address, same unit type, overlapping dates.
     # Expect: first_shared_date not None, match_type="strict", no issues.
     # -------------------------------------------------------
-    pet = PersonData(
-        addresses_lived=[
-            AddressEntry(
-                address=addr("1518 Asterwind Dr", unit_type="Apt", unit_number="2A"),
-                date_from=date(2022, 6, 1),
-                from_precision="day",
-                date_to=date(2022, 9, 30),
-                to_precision="day",
-                address_type="lived",
-            )
-        ]
-    )
+    pet = PersonData(addresses_lived=[_BASE_ENTRY])
 
-    ben = PersonData(
-        addresses_lived=[
-            AddressEntry(
-                address=addr("1518 Asterwind Dr", unit_type="Apt", unit_number="2A"),
-                date_from=date(2022, 7, 1),
-                from_precision="day",
-                date_to=date(2022, 12, 31),
-                to_precision="day",
-                address_type="lived",
-            )
-        ]
-    )
+    ben_entry = _BASE_ENTRY.model_copy(update={"date_from": date(2022, 7, 1), "date_to": date(2022, 12, 31)})
+    ben = PersonData(addresses_lived=[ben_entry])
 
     case1 = ImmigrationCase(petitioner=pet, beneficiary=ben)
     r1 = detect_joint_residency_start(case1, window_start=window_start, window_end=window_end)
@@ -77,32 +69,27 @@ def main():
     assert r1.match_type == "strict"
     assert len(r1.issues) == 0
 
+    # Same answer without building the windows list
+    r1_lazy = detect_joint_residency_start(
+        case1, window_start=window_start, window_end=window_end, materialize_windows=False
+    )
+    assert r1_lazy.first_shared_date == r1.first_shared_date
+    assert r1_lazy.match_type == r1.match_type
+    assert r1_lazy.windows == []
+
     # -------------------------------------------------------
     # TEST 2: Loose-only match (Apt vs Unit)
     # Same street/city/state/country, different unit_type -> strict false, loose true.
     # Expect: match_type="loose" and a medium issue.
     # -------------------------------------------------------
-    pet2 = PersonData(
-        addresses_lived=[
-            AddressEntry(
-                address=addr("1518 Asterwind Dr", unit_type="Apt", unit_number="2A"),
-                date_from=date(2022, 6, 1),
-                from_precision="day",
-                date_to=date(2022, 9, 30),
-                to_precision="day",
-                address_type="lived",
-            )
-        ]
-    )
+    pet2 = PersonData(addresses_lived=[_BASE_ENTRY])
     ben2 = PersonData(
         addresses_lived=[
-            AddressEntry(
-                address=addr("1518 Asterwind Dr", unit_type="Unit", unit_number="2a"),  # unit type differs
-                date_from=date(2022, 7, 1),
-                from_precision="day",
-                date_to=date(2022, 12, 31),
-                to_precision="day",
-                address_type="lived",
+            ben_entry.model_copy(
+                update={
+                    # unit type differs
+                    "address": _BASE_ADDR.model_copy(update={"unit_type": "Unit", "unit_number": "2a"}),
+                }
             )
         ]
     )
@@ -124,27 +111,18 @@ def main():
     # Different streets, no overlap match.
     # Expect: first_shared_date=None and one medium issue.
     # -------------------------------------------------------
+    q1_2022 = {"date_from": date(2022, 1, 1), "date_to": date(2022, 3, 31)}
     pet3 = PersonData(
         addresses_lived=[
-            AddressEntry(
-                address=addr("111 First St", unit_type="Apt", unit_number="1A"),
-                date_from=date(2022, 1, 1),
-                from_precision="day",
-                date_to=date(2022, 3, 31),
-                to_precision="day",
-                address_type="lived",
+            _BASE_ENTRY.model_copy(
+                update={"address": addr("111 First St", unit_type="Apt", unit_number="1A"), **q1_2022}
             )
         ]
     )
     ben3 = PersonData(
         addresses_lived=[
-            AddressEntry(
-                address=addr("999 Ninth St", unit_type="Apt", unit_number="9Z"),
-                date_from=date(2022, 1, 1),
-                from_precision="day",
-                date_to=date(2022, 3, 31),
-                to_precision="day",
-                address_type="lived",
+            _BASE_ENTRY.model_copy(
+                update={"address": addr("999 Ninth St", unit_type="Apt", unit_number="9Z"), **q1_2022}
             )
         ]
     )
@@ -166,4 +144,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    test_joint_residency_scenarios()
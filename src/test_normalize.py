@@ -1,32 +1,76 @@
-from datetime import date
+from datetime import date, datetime
 
-from src.normalize import normalize_date
+import pytest
 
+from src.normalize import NormalizedDate, normalize_date
 
-def show(label: str, nd):
-    print(f"{label:15} → value={nd.value}, precision={nd.precision}, is_present={nd.is_present}")
 
+CASES = [
+    # Day precision
+    ("YYYY-MM-DD", "2023-07-15", date(2023, 7, 15), "day", False),
+    ("YYYY/MM/DD", "2023/07/15", date(2023, 7, 15), "day", False),
+    ("MM/DD/YYYY", "07/15/2023", date(2023, 7, 15), "day", False),
+    # Month precision
+    ("YYYY-MM", "2022-07", date(2022, 7, 1), "month", False),
+    ("YYYY/MM", "2022/07", date(2022, 7, 1), "month", False),
+    ("MM/YYYY", "07/2022", date(2022, 7, 1), "month", False),
+    ("MM-YYYY", "07-2022", date(2022, 7, 1), "month", False),
+    # Year precision
+    ("YYYY", "2021", date(2021, 1, 1), "year", False),
+    # Present
+    ("Present", "Present", None, "day", True),
+    ("current", "current", None, "day", True),
+    # Invalid / unknown
+    ("bad day", "2023-02-31", None, "unknown", False),
+    ("text", "Summer 2022", None, "unknown", False),
+    ("empty", "", None, "unknown", False),
+    ("none", None, None, "unknown", False),
+]
 
-print("\n=== DAY PRECISION ===")
-show("YYYY-MM-DD", normalize_date("2023-07-15"))
-show("YYYY/MM/DD", normalize_date("2023/07/15"))
-show("MM/DD/YYYY", normalize_date("07/15/2023"))
 
-print("\n=== MONTH PRECISION ===")
-show("YYYY-MM", normalize_date("2022-07"))
-show("YYYY/MM", normalize_date("2022/07"))
-show("MM/YYYY", normalize_date("07/2022"))
-show("MM-YYYY", normalize_date("07-2022"))
+@pytest.mark.parametrize("label,s,val,prec,pres", CASES, ids=[c[0] for c in CASES])
+def test_normalize(label, s, val, prec, pres):
+    nd = normalize_date(s)
+    assert (nd.value, nd.precision, nd.is_present) == (val, prec, pres)
 
-print("\n=== YEAR PRECISION ===")
-show("YYYY", normalize_date("2021"))
 
-print("\n=== PRESENT ===")
-show("Present", normalize_date("Present"))
-show("current", normalize_date("current"))
+PASSTHROUGH_CASES = [
+    ("date", date(2023, 7, 15), date(2023, 7, 15), "day"),
+    ("datetime", datetime(2023, 7, 15, 9, 30), date(2023, 7, 15), "day"),
+    ("datetime midnight", datetime(2023, 7, 15), date(2023, 7, 15), "day"),
+]
 
-print("\n=== INVALID / UNKNOWN ===")
-show("bad day", normalize_date("2023-02-31"))
-show("text", normalize_date("Summer 2022"))
-show("empty", normalize_date(""))
-show("none", normalize_date(None))
+
+@pytest.mark.parametrize("label,obj,val,prec", PASSTHROUGH_CASES, ids=[c[0] for c in PASSTHROUGH_CASES])
+def test_normalize_passthrough(label, obj, val, prec):
+    nd = normalize_date(obj)
+    assert (nd.value, nd.precision, nd.is_present) == (val, prec, False)
+    # truncated to a plain date, never a datetime
+    assert type(nd.value) is date
+
+
+@pytest.mark.parametrize(
+    "nd",
+    [
+        NormalizedDate(value=date(2022, 7, 1), precision="month", is_present=False),
+        NormalizedDate(value=None, precision="day", is_present=True),
+        NormalizedDate(value=None, precision="unknown", is_present=False),
+    ],
+    ids=["month", "present", "unknown"],
+)
+def test_normalize_normalized_date_returned_as_is(nd):
+    assert normalize_date(nd) is nd
+
+
+@pytest.mark.parametrize("first", ["datetime", "date"])
+def test_normalize_datetime_cached_alongside_equal_date(first):
+    normalize_date.cache_clear()
+    dt, d = datetime(2023, 7, 15, 9, 30), date(2023, 7, 15)
+    calls = [dt, d] if first == "datetime" else [d, dt]
+    results = [normalize_date(x) for x in calls]
+    # repeat lookups hit the cache and return the same results
+    assert [normalize_date(x) for x in calls] == results
+    assert normalize_date.cache_info().hits >= 2
+    for nd in results:
+        assert (nd.value, nd.precision, nd.is_present) == (d, "day", False)
+        assert type(nd.value) is date
@@ -1,11 +1,15 @@
 from datetime import date
+from functools import cache
+
+import pytest
 
 from src.models import AddressEntry, PostalAddress
 from src.validate import detect_address_overlaps
 
 
+@cache  # one PostalAddress per street; fixtures are read-only
 def make_addr(street: str) -> PostalAddress:
-    return PostalAddress(
+    return PostalAddress.model_construct(
         street_name=street,
         city="Charlotte",
         state_province="NC",
@@ -14,6 +18,7 @@ def make_addr(street: str) -> PostalAddress:
     )
 
 
+# Module-level, immutable fixtures (tuples): built once, only iterated by the validator
 window_start = date(2022, 6, 1)
 window_end = date(2022, 9, 30)
 
@@ -23,8 +28,8 @@ window_end = date(2022, 9, 30)
 # Address B: Aug 1 -> Sep 30
 # Overlap: Aug 1 -> Aug 15
 # -------------------------------------------------------
-addresses_overlap_day_precision = [
-    AddressEntry(
+addresses_overlap_day_precision = (
+    AddressEntry.model_construct(
         address=make_addr("111 First St"),
         date_from=date(2022, 6, 1),
         from_precision="day",
@@ -33,7 +38,7 @@ addresses_overlap_day_precision = [
         address_type="lived",
         notes="A ends Aug 15",
     ),
-    AddressEntry(
+    AddressEntry.model_construct(
         address=make_addr("222 Second St"),
         date_from=date(2022, 8, 1),
         from_precision="day",
@@ -42,30 +47,15 @@ addresses_overlap_day_precision = [
         address_type="lived",
         notes="B starts Aug 1",
     ),
-]
-
-issues = detect_address_overlaps(
-    addresses_overlap_day_precision,
-    window_start=window_start,
-    window_end=window_end,
 )
 
-print("\n=== TEST 1: Day precision overlap (should detect overlap Aug 1–Aug 15) ===")
-if not issues:
-    print("❌ No overlaps detected (unexpected).")
-else:
-    for i in issues:
-        print(f"[{i.severity}] {i.message}")
-        if i.suggested_question:
-            print("  Q:", i.suggested_question)
-
 
 # -------------------------------------------------------
 # TEST 2: Month precision back-to-back (should NOT overlap)
 # June 2022, July 2022, Aug 2022
 # -------------------------------------------------------
-addresses_no_overlap_month_precision = [
-    AddressEntry(
+addresses_no_overlap_month_precision = (
+    AddressEntry.model_construct(
         address=make_addr("333 Third St"),
         date_from=date(2022, 6, 1),
         from_precision="month",
@@ -74,7 +64,7 @@ addresses_no_overlap_month_precision = [
         address_type="lived",
         notes="June 2022",
     ),
-    AddressEntry(
+    AddressEntry.model_construct(
         address=make_addr("444 Fourth St"),
         date_from=date(2022, 7, 1),
         from_precision="month",
@@ -83,7 +73,7 @@ addresses_no_overlap_month_precision = [
         address_type="lived",
         notes="July 2022",
     ),
-    AddressEntry(
+    AddressEntry.model_construct(
         address=make_addr("555 Fifth St"),
         date_from=date(2022, 8, 1),
         from_precision="month",
@@ -92,20 +82,20 @@ addresses_no_overlap_month_precision = [
         address_type="lived",
         notes="Aug 2022",
     ),
+)
+
+
+CASES = [
+    # (label, addresses, expected (severity, start, end) of each overlap)
+    ("day precision overlap", addresses_overlap_day_precision, [("medium", "2022-08-01", "2022-08-15")]),
+    ("month precision back-to-back", addresses_no_overlap_month_precision, []),
 ]
 
-issues2 = detect_address_overlaps(
-    addresses_no_overlap_month_precision,
-    window_start=window_start,
-    window_end=window_end,
-)
 
-print("\n=== TEST 2: Month precision (should be NO overlaps) ===")
-if not issues2:
-    print("✅ No overlaps detected (correct).")
-else:
-    print("❌ Unexpected overlaps detected:")
-    for i in issues2:
-        print(f"[{i.severity}] {i.message}")
-        if i.suggested_question:
-            print("  Q:", i.suggested_question)
+@pytest.mark.parametrize("label,addresses,expected", CASES, ids=[c[0] for c in CASES])
+def test_address_overlaps(label, addresses, expected):
+    issues = detect_address_overlaps(addresses, window_start=window_start, window_end=window_end)
+    assert len(issues) == len(expected)
+    for issue, (severity, start, end) in zip(issues, expected):
+        assert issue.severity == severity
+        assert f"{start} to {end}" in issue.message
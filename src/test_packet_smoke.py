@@ -1,62 +1,14 @@
 # src/test_packet_smoke.py
 
-from datetime import date
 import json
 
 from src.pipeline import load_case_from_json
+from src.smoke_fixtures import SMOKE_TODAY, fresh_case
 from src.packet import build_attorney_review_packet
 
 
-def main():
-    today = date(2025, 12, 29)
-
-    raw = {
-        "beneficiary": {
-            "addresses": [
-                {
-                    "street_name": "111 First St",
-                    "city": "Charlotte",
-                    "state_province": "North Carolina",
-                    "zip_code": "28209",
-                    "country": "USA",
-                    "date_from": "06/2022",
-                    "date_to": "07/2022",
-                    "address_type": "lived",
-                },
-                {
-                    "street_name": "222 Second St",
-                    "city": "Charlotte",
-                    "state_province": "NC",
-                    "zip_code": "28209",
-                    "country": "USA",
-                    "date_from": "2022-02-31",  # invalid
-                    "date_to": "Present",
-                    "address_type": "lived",
-                },
-            ],
-            "employment": [
-                {
-                    "employer": "Vexa Consulting",
-                    "role": "Analyst",
-                    "date_from": "08/2025",
-                    "date_to": "Present",
-                    "employment_type": "self_employed",
-                }
-            ],
-            "travel": [
-                {
-                    "event_type": "entry",
-                    "date": "07/15/2023",
-                    "port_or_city": "JFK",
-                    "status_or_class": "B2",
-                }
-            ],
-        },
-        "petitioner": {"addresses": [], "employment": [], "travel": []},
-        "marriage": {"date": "06/15/2025", "city": "Charlotte", "state": "NC", "country": "USA"},
-    }
-
-    result = load_case_from_json(raw, today=today)
+def test_packet_smoke():
+    result = load_case_from_json(fresh_case(), today=SMOKE_TODAY)
     packet = build_attorney_review_packet(result)
 
     # Pretty print a short version
@@ -75,4 +27,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    test_packet_smoke()
@@ -1,70 +1,13 @@
 # src/test_pipeline_smoke.py
 
-from datetime import date
+import sys
 
 from src.pipeline import load_case_from_json
+from src.smoke_fixtures import SMOKE_TODAY, fresh_case
 
 
-def main():
-    # Use a fixed "today" so results are deterministic
-    today = date(2025, 12, 29)
-
-    raw = {
-        "beneficiary": {
-            "addresses": [
-                {
-                    "street_name": "111 First St",
-                    "city": "Charlotte",
-                    "state_province": "North Carolina",  # warns (US code)
-                    "zip_code": "28209",
-                    "country": "USA",
-                    "date_from": "06/2022",
-                    "date_to": "07/2022",
-                    "address_type": "lived",
-                },
-                {
-                    "street_name": "222 Second St",
-                    "city": "Charlotte",
-                    "state_province": "NC",
-                    "zip_code": "28209",
-                    "country": "USA",
-                    "date_from": "2022-02-31",  # invalid -> high issue
-                    "date_to": "Present",
-                    "address_type": "lived",
-                },
-            ],
-            "employment": [
-                {
-                    "employer": "Vexa Consulting",
-                    "role": "Analyst",
-                    "date_from": "08/2025",
-                    "date_to": "Present",
-                    "employment_type": "self_employed",
-                }
-            ],
-            "travel": [
-                {
-                    "event_type": "entry",
-                    "date": "07/15/2023",
-                    "port_or_city": "JFK",
-                    "status_or_class": "B2",
-                }
-            ],
-        },
-        "petitioner": {
-            "addresses": [],
-            "employment": [],
-            "travel": [],
-        },
-        "marriage": {
-            "date": "06/15/2025",
-            "city": "Charlotte",
-            "state": "NC",
-            "country": "USA",
-        },
-    }
-
-    result = load_case_from_json(raw, today=today, validate_petitioner=False)
+def test_pipeline_smoke():
+    result = load_case_from_json(fresh_case(), today=SMOKE_TODAY, validate_petitioner=False)
 
     print("\n=== Window ===")
     print("start:", result.window_start)
@@ -76,16 +19,18 @@ def main():
     print("beneficiary employment parsed:", len(result.case.beneficiary.employment))
     print("beneficiary travel parsed:", len(result.case.beneficiary.travel_entries))
 
-    print("\n=== Snapshots ===")
+    # Build the per-item listings, then write them in one go
+    lines = ["\n=== Snapshots ==="]
     for s in result.snapshots:
-        print(f"- id={s.id} section={s.section} keys={list(s.raw.keys())}")
+        lines.append(f"- id={s.id} section={s.section} keys={list(s.raw)}")
 
-    print("\n=== Issues ===")
+    lines.append("\n=== Issues ===")
     for i in result.issues:
-        print(f"[{i.severity}] ({i.category}) ref_id={i.ref_id} :: {i.message}")
+        lines.append(f"[{i.severity}] ({i.category}) ref_id={i.ref_id} :: {i.message}")
         if i.suggested_question:
-            print("  Q:", i.suggested_question)
+            lines.append("  Q: " + i.suggested_question)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    test_pipeline_smoke()
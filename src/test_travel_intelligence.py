@@ -3,80 +3,94 @@ from src.models import TravelEntry, EmploymentEntry
 from src.travel_intelligence import analyze_travel
 
 
+# Message fragments the tests look for
+MARKERS = (
+    "Two entries in a row",
+    "Exit recorded",
+    "First in-window travel event is an entry",
+    "without a preceding exit",
+    "Extended time outside",
+    "missing whether you were inspected",
+    "missing class of admission",
+    "missing I-94 number",
+    "overlaps an active",
+)
+
+
+def _entries(events):
+    """TravelEntry list from (event_type, date) pairs."""
+    return [TravelEntry.model_construct(event_type=e, date=d) for e, d in events]
+
+
+def tags(res):
+    """{(severity, marker)} for every marker found in an issue message."""
+    return {(i.severity, m) for i in res.issues for m in MARKERS if m in i.message}
+
+
 def test_two_entries_in_a_row_is_high():
     res = analyze_travel(
-        [
-            TravelEntry(event_type="entry", date=date(2020, 1, 10)),
-            TravelEntry(event_type="entry", date=date(2020, 2, 10)),
-        ],
+        _entries([("entry", date(2020, 1, 10)), ("entry", date(2020, 2, 10))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
-    assert any(i.severity == "high" and "Two entries in a row" in i.message for i in res.issues)
+    assert ("high", "Two entries in a row") in tags(res)
 
 
 def test_unmatched_exit_is_high():
     res = analyze_travel(
-        [TravelEntry(event_type="exit", date=date(2020, 6, 1))],
+        _entries([("exit", date(2020, 6, 1))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
-    assert any(i.severity == "high" and "Exit recorded" in i.message for i in res.issues)
+    assert ("high", "Exit recorded") in tags(res)
 
 
 def test_entry_without_prior_exit_first_event_is_low():
     res = analyze_travel(
-        [TravelEntry(event_type="entry", date=date(2020, 6, 1))],
+        _entries([("entry", date(2020, 6, 1))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
-    assert any(i.severity == "low" and "First in-window travel event is an entry" in i.message for i in res.issues)
+    assert ("low", "First in-window travel event is an entry") in tags(res)
 
 
 def test_entry_without_prior_exit_mid_window_is_high():
     res = analyze_travel(
-        [
-            TravelEntry(event_type="exit", date=date(2020, 1, 1)),
-            TravelEntry(event_type="entry", date=date(2020, 1, 2)),
-            TravelEntry(event_type="entry", date=date(2020, 2, 1)),  # entry without prior exit mid-window
-        ],
+        # entry without prior exit mid-window
+        _entries([("exit", date(2020, 1, 1)), ("entry", date(2020, 1, 2)), ("entry", date(2020, 2, 1))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
-    assert any(i.severity == "high" and "without a preceding exit" in i.message for i in res.issues)
+    assert ("high", "without a preceding exit") in tags(res)
 
 
 def test_long_absence_180_is_high():
     res = analyze_travel(
-        [
-            TravelEntry(event_type="exit", date=date(2020, 1, 1)),
-            TravelEntry(event_type="entry", date=date(2020, 6, 28)),  # inclusive 180 days in 2020
-        ],
+        # inclusive 180 days in 2020
+        _entries([("exit", date(2020, 1, 1)), ("entry", date(2020, 6, 28))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
-    assert any(i.severity == "high" and "Extended time outside" in i.message for i in res.issues)
+    assert ("high", "Extended time outside") in tags(res)
 
 
 def test_last_entry_missing_status_i94_inspected_is_high_when_inferred_in_us():
     res = analyze_travel(
-        [TravelEntry(event_type="entry", date=date(2020, 6, 1))],
+        _entries([("entry", date(2020, 6, 1))]),
         window_start=date(2020, 1, 1),
         window_end=date(2020, 12, 31),
     )
+    found = tags(res)
     # should flag missing inspected + missing status + missing i94
-    assert any(i.severity == "high" and "missing whether you were inspected" in i.message for i in res.issues)
-    assert any(i.severity == "high" and "missing class of admission" in i.message for i in res.issues)
-    assert any(i.severity == "high" and "missing I-94 number" in i.message for i in res.issues)
+    assert ("high", "missing whether you were inspected") in found
+    assert ("high", "missing class of admission") in found
+    assert ("high", "missing I-94 number") in found
 
 
 def test_travel_overlaps_employment_flags():
-    travel = [
-        TravelEntry(event_type="exit", date=date(2020, 2, 1)),
-        TravelEntry(event_type="entry", date=date(2020, 5, 1)),
-    ]
+    travel = _entries([("exit", date(2020, 2, 1)), ("entry", date(2020, 5, 1))])
     emp = [
-        EmploymentEntry(
+        EmploymentEntry.model_construct(
             employer="ACME",
             date_from=date(2020, 1, 1),
             from_precision="day",
@@ -91,4 +105,5 @@ def test_travel_overlaps_employment_flags():
         window_end=date(2020, 12, 31),
         employment=emp,
     )
-    assert any("overlaps an active" in i.message for i in res.issues)
+    # Feb 1 - May 1 2020 is 91 days abroad: the >= 90-day HIGH branch
+    assert ("high", "overlaps an active") in tags(res)
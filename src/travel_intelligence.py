@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import List, Optional, Literal, Tuple
+from datetime import date
+from itertools import accumulate
+from typing import List, NamedTuple, Optional, Literal, Tuple
 
-from .models import TravelEntry, EmploymentEntry, DatePrecision
+from .date_bounds import build_ranges
+from .models import TravelEntry, EmploymentEntry
 from .validate import Issue
 
 
-@dataclass(frozen=True)
-class TravelInterval:
+class TravelInterval(NamedTuple):
     exit_date: date
     entry_date: date
     days_abroad: int
@@ -27,67 +29,31 @@ class TravelAnalysisResult:
     inferred_in_us: Optional[bool]  # True=in US, False=outside US, None=unknown
 
 
-# -------------------------
-# Precision helpers (aligned with validate.py patterns)
-# -------------------------
-
-def _last_day_of_month(y: int, m: int) -> date:
-    if m == 12:
-        return date(y, 12, 31)
-    return date(y, m + 1, 1) - timedelta(days=1)
-
-
-def _precision_range_start(d: date, precision: DatePrecision) -> date:
-    if precision == "day":
-        return d
-    if precision == "month":
-        return date(d.year, d.month, 1)
-    # year
-    return date(d.year, 1, 1)
-
-
-def _precision_range_end(d: date, precision: DatePrecision) -> date:
-    if precision == "day":
-        return d
-    if precision == "month":
-        return _last_day_of_month(d.year, d.month)
-    # year
-    return date(d.year, 12, 31)
-
-
-def _build_employment_ranges(
-    employment: List[EmploymentEntry],
-    *,
-    window_start: date,
-    window_end: date,
-) -> List[Tuple[date, date, EmploymentEntry]]:
-    """
-    Build precision-aware employment ranges, clamped to window.
-    Assumes EmploymentEntry has from_precision/to_precision (as in your employment gaps/overlaps work).
-    """
-    ranges: List[Tuple[date, date, EmploymentEntry]] = []
-    for e in employment:
-        start = _precision_range_start(e.date_from, e.from_precision)
-
-        effective_end = e.date_to or window_end
-        end_precision: DatePrecision = e.to_precision if e.date_to is not None else "day"
-        end = _precision_range_end(effective_end, end_precision)
-
-        if end < window_start or start > window_end:
-            continue
-
-        ranges.append((max(start, window_start), min(end, window_end), e))
-
-    ranges.sort(key=lambda x: (x[0], x[1]))
-    return ranges
-
-
-def _days_inclusive(d1: date, d2: date) -> int:
-    return (d2 - d1).days + 1
-
-
-def _ranges_overlap(a_start: date, a_end: date, b_start: date, b_end: date) -> bool:
-    return max(a_start, b_start) <= min(a_end, b_end)
+# Employment types that count as "actively working" for the travel-vs-employment check.
+_ACTIVE_EMPLOYMENT_TYPES = frozenset({"employed", "self_employed"})
+
+# Event-type ranks used as the sort tie-break and as int flags in the pairing loop.
+_EXIT_RANK = 0
+_ENTRY_RANK = 1
+
+# Fixed follow-up questions attached to travel Issues.
+_Q_TWO_EXITS = "Please provide the re-entry date after the first exit (or confirm/correct the travel sequence)."
+_Q_TWO_ENTRIES = "Please provide the departure/exit date between these entries (or confirm/correct the travel sequence)."
+_Q_REPEATED_EXIT = "Please provide the re-entry date after that exit (or confirm/correct the sequence)."
+_Q_BASELINE_ENTRY = "If you departed the U.S. before this entry outside the required window, you can ignore. Otherwise, please provide the exit date."
+_Q_ENTRY_WITHOUT_EXIT = "Please provide the exit date prior to this entry (or correct the travel sequence)."
+_Q_EXTENDED_ABSENCE = "Please confirm this trip duration and explain how you maintained your U.S. residence during this period."
+_Q_SIGNIFICANT_ABSENCE = "Please confirm this trip duration and whether it affected your U.S. residence or employment."
+_Q_UNMATCHED_EXIT = "Please provide your re-entry date after this exit (or confirm you have not re-entered yet)."
+_Q_OVERLAPPING_TRIPS = "Please correct the travel dates so trips do not overlap."
+_Q_NOT_INSPECTED = "Please confirm how you entered the U.S. on that date. Adjustment of Status generally requires inspection/admission or parole."
+_Q_INSPECTION_MISSING = "Were you inspected/admitted/paroled on your last entry? If yes, provide class of admission and I-94 number (if issued)."
+_Q_CLASS_MISSING = "Please provide the class of admission for your last entry (e.g., B2, F1, H1B, parole)."
+_Q_I94_MISSING = "Please provide the I-94 number for your last entry (electronic or paper). If no new I-94 was issued for a brief trip, please confirm."
+_Q_EMPLOYMENT_OVERLAP = (
+    "Please confirm whether you were working remotely while abroad, on leave, or if the employment dates should be adjusted. "
+    "If applicable, clarify your work location during the trip."
+)
 
 
 def analyze_travel(
@@ -139,8 +105,15 @@ def analyze_travel(
 
     # Filter to window and sort.
     # Tie-break: exits before entries on same day (conservative pairing).
-    events = [e for e in travel_entries if window_start <= e.date <= window_end]
-    events.sort(key=lambda e: (e.date, 0 if e.event_type == "exit" else 1))
+    # Decorate with (ordinal, type rank, input position) so the sort compares
+    # plain int tuples; the position keeps it stable and never reaches `e`.
+    decorated = [
+        (e.date.toordinal(), _EXIT_RANK if e.event_type == "exit" else _ENTRY_RANK, pos, e)
+        for pos, e in enumerate(travel_entries)
+        if window_start <= e.date <= window_end
+    ]
+    decorated.sort()
+    events = [d[3] for d in decorated]
 
     if not events:
         return TravelAnalysisResult(
@@ -151,8 +124,13 @@ def analyze_travel(
             inferred_in_us=None,
         )
 
+    # Day ordinals, converted once; the pairing loop and overlap sweep work on ints.
+    ords = [d[0] for d in decorated]
+    ranks = [d[1] for d in decorated]
+
     issues: List[Issue] = []
     intervals: List[TravelInterval] = []
+    spans: List[Tuple[int, int]] = []  # (exit_ord, entry_ord), parallel to intervals
 
     last_event = events[-1]
     if last_event.event_type == "entry":
@@ -163,18 +141,21 @@ def analyze_travel(
         inferred_in_us = None
 
     last_exit: Optional[TravelEntry] = None
+    last_exit_ord = 0
     last_event_seen: Optional[TravelEntry] = None
+    prev_rank = -1  # rank of last_event_seen; -1 before the first event
 
     for idx, e in enumerate(events):
+        rank = ranks[idx]
         # Detect consecutive identical event types (integrity / missing opposite event).
-        if last_event_seen and last_event_seen.event_type == e.event_type:
-            if e.event_type == "exit":
+        if rank == prev_rank:
+            if rank == _EXIT_RANK:
                 issues.append(
                     Issue(
                         severity="high",
                         category="travel",
                         message=f"Two exits in a row without an entry in between ({last_event_seen.date} and {e.date}).",
-                        suggested_question="Please provide the re-entry date after the first exit (or confirm/correct the travel sequence).",
+                        suggested_question=_Q_TWO_EXITS,
                     )
                 )
             else:  # entry
@@ -184,11 +165,12 @@ def analyze_travel(
                         severity="high",
                         category="travel",
                         message=f"Two entries in a row without an exit in between ({last_event_seen.date} and {e.date}).",
-                        suggested_question="Please provide the departure/exit date between these entries (or confirm/correct the travel sequence).",
+                        suggested_question=_Q_TWO_ENTRIES,
                     )
                 )
+        prev_rank = rank
 
-        if e.event_type == "exit":
+        if rank == _EXIT_RANK:
             # If we already have an unmatched exit, flag (also covered by exit->exit check above, but keep explicit).
             if last_exit is not None:
                 issues.append(
@@ -196,10 +178,11 @@ def analyze_travel(
                         severity="high",
                         category="travel",
                         message=f"Multiple exits recorded without an entry in between (previous exit on {last_exit.date}).",
-                        suggested_question="Please provide the re-entry date after that exit (or confirm/correct the sequence).",
+                        suggested_question=_Q_REPEATED_EXIT,
                     )
                 )
             last_exit = e
+            last_exit_ord = ords[idx]
             last_event_seen = e
             continue
 
@@ -212,7 +195,7 @@ def analyze_travel(
                         severity="low",
                         category="travel",
                         message=f"First in-window travel event is an entry on {e.date} without a preceding in-window exit.",
-                        suggested_question="If you departed the U.S. before this entry outside the required window, you can ignore. Otherwise, please provide the exit date.",
+                        suggested_question=_Q_BASELINE_ENTRY,
                     )
                 )
             else:
@@ -222,16 +205,17 @@ def analyze_travel(
                         severity="high",
                         category="travel",
                         message=f"Entry recorded on {e.date} without a preceding exit in the selected window.",
-                        suggested_question="Please provide the exit date prior to this entry (or correct the travel sequence).",
+                        suggested_question=_Q_ENTRY_WITHOUT_EXIT,
                     )
                 )
             last_event_seen = e
             continue
 
         # Pair exit -> entry
-        days_abroad = _days_inclusive(last_exit.date, e.date)
+        days_abroad = ords[idx] - last_exit_ord + 1
         is_brief = days_abroad == 1
 
+        spans.append((last_exit_ord, ords[idx]))
         intervals.append(
             TravelInterval(
                 exit_date=last_exit.date,
@@ -249,7 +233,7 @@ def analyze_travel(
                         severity="high",
                         category="travel",
                         message=f"Extended time outside the U.S.: {days_abroad} day(s) from {last_exit.date} to {e.date}.",
-                        suggested_question="Please confirm this trip duration and explain how you maintained your U.S. residence during this period.",
+                        suggested_question=_Q_EXTENDED_ABSENCE,
                     )
                 )
             elif days_abroad >= 90:
@@ -258,7 +242,7 @@ def analyze_travel(
                         severity="medium",
                         category="travel",
                         message=f"Significant time outside the U.S.: {days_abroad} day(s) from {last_exit.date} to {e.date}.",
-                        suggested_question="Please confirm this trip duration and whether it affected your U.S. residence or employment.",
+                        suggested_question=_Q_SIGNIFICANT_ABSENCE,
                     )
                 )
 
@@ -272,16 +256,21 @@ def analyze_travel(
                 severity="high",
                 category="travel",
                 message=f"Exit recorded on {last_exit.date} without a corresponding entry date in the selected window.",
-                suggested_question="Please provide your re-entry date after this exit (or confirm you have not re-entered yet).",
+                suggested_question=_Q_UNMATCHED_EXIT,
             )
         )
 
     # Overlapping travel intervals => HIGH (sweep)
-    if len(intervals) >= 2:
-        sorted_intervals = sorted(intervals, key=lambda x: (x.exit_date, x.entry_date))
-        active = sorted_intervals[0]
-        for curr in sorted_intervals[1:]:
-            if _ranges_overlap(active.exit_date, active.entry_date, curr.exit_date, curr.entry_date):
+    # Pairing walks events in date order, so spans are already sorted by exit.
+    # Track the running max end (and the interval that set it): a later span
+    # overlaps iff it starts on or before that end.
+    if len(spans) >= 2:
+        max_end = spans[0][1]
+        active = intervals[0]
+        for i in range(1, len(spans)):
+            c_s, c_e = spans[i]
+            if c_s <= max_end:
+                curr = intervals[i]
                 issues.append(
                     Issue(
                         severity="high",
@@ -290,28 +279,27 @@ def analyze_travel(
                             "Overlapping travel intervals detected: "
                             f"{active.exit_date}–{active.entry_date} overlaps {curr.exit_date}–{curr.entry_date}."
                         ),
-                        suggested_question="Please correct the travel dates so trips do not overlap.",
+                        suggested_question=_Q_OVERLAPPING_TRIPS,
                     )
                 )
             # advance active to the interval with the later entry_date
-            if curr.entry_date > active.entry_date:
-                active = curr
+            if c_e > max_end:
+                max_end = c_e
+                active = intervals[i]
 
     # Last Entry Legal Status checks (HIGH) when inferred_in_us=True
-    last_entry: Optional[TravelEntry] = None
-    for e in reversed(events):
-        if e.event_type == "entry":
-            last_entry = e
-            break
+    # inferred_in_us is True exactly when the final in-window event is an entry,
+    # so that event is the last entry; no need to rescan the list for it.
+    last_entry: Optional[TravelEntry] = last_event if inferred_in_us is True else None
 
-    if inferred_in_us is True and last_entry is not None:
+    if last_entry is not None:
         if last_entry.inspected is False:
             issues.append(
                 Issue(
                     severity="high",
                     category="travel",
                     message=f"Last entry on {last_entry.date} indicates NOT inspected/admitted/paroled.",
-                    suggested_question="Please confirm how you entered the U.S. on that date. Adjustment of Status generally requires inspection/admission or parole.",
+                    suggested_question=_Q_NOT_INSPECTED,
                 )
             )
         if last_entry.inspected is None:
@@ -320,7 +308,7 @@ def analyze_travel(
                     severity="high",
                     category="travel",
                     message=f"Last entry on {last_entry.date} is missing whether you were inspected/admitted/paroled.",
-                    suggested_question="Were you inspected/admitted/paroled on your last entry? If yes, provide class of admission and I-94 number (if issued).",
+                    suggested_question=_Q_INSPECTION_MISSING,
                 )
             )
         if not last_entry.status_or_class:
@@ -329,7 +317,7 @@ def analyze_travel(
                     severity="high",
                     category="travel",
                     message=f"Last entry on {last_entry.date} is missing class of admission/status.",
-                    suggested_question="Please provide the class of admission for your last entry (e.g., B2, F1, H1B, parole).",
+                    suggested_question=_Q_CLASS_MISSING,
                 )
             )
         if not last_entry.i94_number:
@@ -338,23 +326,37 @@ def analyze_travel(
                     severity="high",
                     category="travel",
                     message=f"Last entry on {last_entry.date} is missing I-94 number.",
-                    suggested_question="Please provide the I-94 number for your last entry (electronic or paper). If no new I-94 was issued for a brief trip, please confirm.",
+                    suggested_question=_Q_I94_MISSING,
                 )
             )
 
     # Travel vs Employment overlap (clarification, not accusation)
     if employment:
-        emp_ranges = _build_employment_ranges(employment, window_start=window_start, window_end=window_end)
-
-        for t in intervals:
+        emp_ranges = [
+            r
+            for r in build_ranges(employment, window_start=window_start, window_end=window_end)
+            # an inverted range (end before start) can never overlap a trip
+            if r[2].employment_type in _ACTIVE_EMPLOYMENT_TYPES and r[0] <= r[1]
+        ]
+
+        # Ranges are sorted by start. Ranges past bisect_right(starts, trip end)
+        # begin after the trip; ranges before bisect_left(running max end, trip
+        # start) all end before it. Only the slice between can overlap, and it
+        # is scanned in the original order.
+        emp_starts = [r[0] for r in emp_ranges]
+        emp_ends = [r[1] for r in emp_ranges]
+        emp_max_ends = list(accumulate(emp_ends, max))
+
+        for i, t in enumerate(intervals):
             if t.is_brief:
                 continue  # don't over-flag same-day border runs
 
-            for emp_start, emp_end, emp in emp_ranges:
-                if emp.employment_type not in {"employed", "self_employed"}:
-                    continue
-
-                if _ranges_overlap(t.exit_date, t.entry_date, emp_start, emp_end):
+            t_start, t_end = spans[i]
+            for j in range(bisect_left(emp_max_ends, t_start), bisect_right(emp_starts, t_end)):
+                if emp_ends[j] >= t_start:
+                    emp = emp_ranges[j][2]
+                    emp_start = date.fromordinal(emp_starts[j])
+                    emp_end = date.fromordinal(emp_ends[j])
                     sev: Literal["high", "medium"] = "high" if t.days_abroad >= 90 else "medium"
                     issues.append(
                         Issue(
@@ -364,10 +366,7 @@ def analyze_travel(
                                 f"Travel interval {t.exit_date}–{t.entry_date} overlaps an active "
                                 f"{emp.employment_type} period ({emp_start}–{emp_end}) at {emp.employer!r}."
                             ),
-                            suggested_question=(
-                                "Please confirm whether you were working remotely while abroad, on leave, or if the employment dates should be adjusted. "
-                                "If applicable, clarify your work location during the trip."
-                            ),
+                            suggested_question=_Q_EMPLOYMENT_OVERLAP,
                         )
                     )
 
@@ -3,20 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import Optional, List, Literal, Tuple
+from datetime import date
+from typing import NamedTuple, Optional, List, Literal, Tuple, TypeVar
 
-from .models import AddressEntry, EmploymentEntry, DatePrecision
+from .date_bounds import build_ranges, entry_bounds
+from .models import AddressEntry, EmploymentEntry
 
 
-@dataclass(frozen=True)
-class DateWithPrecision:
-    value: date
-    precision: DatePrecision
+class Issue(NamedTuple):
+    """One validation finding. ref_id stays last: issues.tag_issues fills it in positionally."""
 
-
-@dataclass(frozen=True)
-class Issue:
     severity: Literal["high", "medium", "low"]
     category: str
     message: str
@@ -24,269 +20,327 @@ class Issue:
     ref_id: Optional[str] = None
 
 
-def _last_day_of_month(y: int, m: int) -> date:
-    if m == 12:
-        return date(y, 12, 31)
-    return date(y, m + 1, 1) - timedelta(days=1)
-
-
-def _precision_range_start(dwp: DateWithPrecision) -> date:
-    """Earliest possible date for the given precision."""
-    if dwp.precision == "day":
-        return dwp.value
-    if dwp.precision == "month":
-        return date(dwp.value.year, dwp.value.month, 1)
-    # year
-    return date(dwp.value.year, 1, 1)
+_E = TypeVar("_E", AddressEntry, EmploymentEntry)
 
 
-def _precision_range_end(dwp: DateWithPrecision) -> date:
-    """Latest possible date for the given precision."""
-    if dwp.precision == "day":
-        return dwp.value
-    if dwp.precision == "month":
-        return _last_day_of_month(dwp.value.year, dwp.value.month)
-    # year
-    return date(dwp.value.year, 12, 31)
-
+def _sweep(ranges: List[Tuple[int, int, _E]]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]], int]:
+    """
+    One high-water-mark pass over sorted ordinal ranges, shared by gap and overlap detection.
 
-def _build_address_ranges(
-    addresses: List[AddressEntry],
-    *,
-    window_start: date,
-    window_end: date,
-) -> List[Tuple[date, date, AddressEntry]]:
+    Returns (gaps, overlaps, max_end):
+      gaps     -- (from, to) of uncovered days between ranges
+      overlaps -- (from, to) of days a range shares with the furthest-reaching earlier one
+      max_end  -- furthest end covered (for the end-of-window gap)
     """
-    Convert AddressEntry records into clamped coverage ranges within [window_start, window_end].
+    gaps: List[Tuple[int, int]] = []
+    overlaps: List[Tuple[int, int]] = []
 
-    Each entry covers:
-      start = earliest possible date based on from_precision
-      end   = latest possible date based on to_precision
+    max_end = ranges[0][1]
+    for curr_start, curr_end, _entry in ranges[1:]:
+        if curr_start > max_end + 1:
+            gaps.append((max_end + 1, curr_start - 1))
+        elif curr_start <= max_end:
+            overlaps.append((curr_start, curr_end if curr_end < max_end else max_end))
 
-    date_to=None means "Present", treated as covering through window_end with day precision.
-    """
-    ranges: List[Tuple[date, date, AddressEntry]] = []
+        # Advance the high-water mark to whichever range extends further
+        if curr_end > max_end:
+            max_end = curr_end
 
-    for entry in addresses:
-        start = _precision_range_start(DateWithPrecision(entry.date_from, entry.from_precision))
+    return gaps, overlaps, max_end
 
-        effective_end = entry.date_to or window_end
-        end_precision: DatePrecision = entry.to_precision if entry.date_to is not None else "day"
-        end = _precision_range_end(DateWithPrecision(effective_end, end_precision))
 
-        # Ignore entries fully outside window
-        if end < window_start or start > window_end:
-            continue
+def _middle_gap_severity(gap_days: int) -> Literal["high", "medium"]:
+    return "medium" if gap_days == 1 else "high"
 
-        # Clamp to window
-        start = max(start, window_start)
-        end = min(end, window_end)
 
-        ranges.append((start, end, entry))
+def _overlap_severity(overlap_days: int) -> Literal["high", "medium", "low"]:
+    if overlap_days == 1:
+        return "low"
+    if overlap_days < 30:
+        return "medium"
+    return "high"
 
-    ranges.sort(key=lambda x: (x[0], x[1]))
-    return ranges
 
+@dataclass(frozen=True, slots=True)
+class _HistoryKind:
+    """Category and wording that distinguish address from employment history checks."""
 
-def detect_address_gaps(
-    addresses: List[AddressEntry],
+    category: str
+    title: str  # window-edge gap messages: "<title> gap at the start of the window"
+    noun: str  # middle gap messages: "Unexplained <noun> gap of N day(s)"
+    gap_question: str  # "<gap_question> from A to B?"
+    start_gap_hint: str  # appended to the start-of-window gap question
+    overlap_subject: str  # "Overlapping <overlap_subject> for N day(s)"
+    overlap_question: str  # "<overlap_question> from A to B. <overlap_follow_up>"
+    overlap_follow_up: str
+    no_entries: Issue
+    no_entries_in_window: Issue
+
+
+def _gap_issues(
+    kind: _HistoryKind,
+    first_start: int,
+    gaps: List[Tuple[int, int]],
+    max_end: int,
     *,
     window_start: date,
     window_end: date,
 ) -> List[Issue]:
-    """
-    Precision-aware gap detection for residential address history.
-
-    Hybrid severity policy:
-      - Start-of-window gaps: HIGH (even 1 day)
-      - End-of-window gaps:   HIGH (even 1 day)
-      - Middle gaps:
-          * 1 day   -> MEDIUM
-          * >=2 days -> HIGH
-    """
-
-    def _middle_gap_severity(gap_days: int) -> Literal["high", "medium"]:
-        return "medium" if gap_days == 1 else "high"
+    issues: List[Issue] = []
 
-    if not addresses:
-        return [
+    # Start gap (always HIGH)
+    if first_start > window_start.toordinal():
+        gap_from = window_start
+        gap_to = date.fromordinal(first_start - 1)
+        issues.append(
             Issue(
                 severity="high",
-                category="address_history",
-                message="No residential addresses provided for the selected window.",
-                suggested_question="Please provide your residential address history for the required period.",
+                category=kind.category,
+                message=f"{kind.title} gap at the start of the window: {gap_from} to {gap_to}.",
+                suggested_question=f"{kind.gap_question} from {gap_from} to {gap_to}{kind.start_gap_hint}?",
             )
-        ]
+        )
 
-    # Reuse shared range builder (precision-aware + window-clamped)
-    raw_ranges = _build_address_ranges(addresses, window_start=window_start, window_end=window_end)
+    # Middle gaps (from the high-water-mark sweep, so nested/overlapping ranges are handled)
+    for from_ord, to_ord in gaps:
+        gap_days = to_ord - from_ord + 1
+        gap_from = date.fromordinal(from_ord)
+        gap_to = date.fromordinal(to_ord)
 
-    if not raw_ranges:
-        return [
+        issues.append(
             Issue(
-                severity="high",
-                category="address_history",
-                message="No residential addresses overlap the required window.",
-                suggested_question="Please confirm your residential address history for the required period.",
+                severity=_middle_gap_severity(gap_days),
+                category=kind.category,
+                message=f"Unexplained {kind.noun} gap of {gap_days} day(s): {gap_from} to {gap_to}.",
+                suggested_question=f"{kind.gap_question} from {gap_from} to {gap_to}?",
             )
-        ]
-
-    # We only need (start, end) for gap math
-    ranges = [(start, end) for start, end, _entry in raw_ranges]
-
-    issues: List[Issue] = []
+        )
 
-    # Start gap (always HIGH)
-    first_start = ranges[0][0]
-    if first_start > window_start:
-        gap_from = window_start
-        gap_to = first_start - timedelta(days=1)
+    # End gap (always HIGH)
+    if max_end < window_end.toordinal():
+        gap_from = date.fromordinal(max_end + 1)
+        gap_to = window_end
         issues.append(
             Issue(
                 severity="high",
-                category="address_history",
-                message=f"Address gap at the start of the window: {gap_from} to {gap_to}.",
-                suggested_question=f"Where did you live from {gap_from} to {gap_to}?",
+                category=kind.category,
+                message=f"{kind.title} gap at the end of the window: {gap_from} to {gap_to}.",
+                suggested_question=f"{kind.gap_question} from {gap_from} to {gap_to}?",
             )
         )
 
-    # Middle gaps (track high-water mark to handle nested/overlapping ranges)
-    current_max_end = ranges[0][1]
-    for curr_start, curr_end in ranges[1:]:
-        if curr_start > current_max_end + timedelta(days=1):
-            gap_from = current_max_end + timedelta(days=1)
-            gap_to = curr_start - timedelta(days=1)
-            gap_days = (gap_to - gap_from).days + 1
-
-            issues.append(
-                Issue(
-                    severity=_middle_gap_severity(gap_days),
-                    category="address_history",
-                    message=f"Unexplained address gap of {gap_days} day(s): {gap_from} to {gap_to}.",
-                    suggested_question=f"Where did you live from {gap_from} to {gap_to}?",
-                )
-            )
+    return issues
 
-        current_max_end = max(current_max_end, curr_end)
 
-    # End gap (always HIGH)
-    if current_max_end < window_end:
-        gap_from = current_max_end + timedelta(days=1)
-        gap_to = window_end
+def _overlap_issues(kind: _HistoryKind, overlaps: List[Tuple[int, int]]) -> List[Issue]:
+    issues: List[Issue] = []
+
+    for from_ord, to_ord in overlaps:
+        overlap_days = to_ord - from_ord + 1
+        overlap_from = date.fromordinal(from_ord)
+        overlap_to = date.fromordinal(to_ord)
+
         issues.append(
             Issue(
-                severity="high",
-                category="address_history",
-                message=f"Address gap at the end of the window: {gap_from} to {gap_to}.",
-                suggested_question=f"Where did you live from {gap_from} to {gap_to}?",
+                severity=_overlap_severity(overlap_days),
+                category=kind.category,
+                message=f"Overlapping {kind.overlap_subject} for {overlap_days} day(s): {overlap_from} to {overlap_to}.",
+                suggested_question=(
+                    f"{kind.overlap_question} from {overlap_from} to {overlap_to}. {kind.overlap_follow_up}"
+                ),
             )
         )
 
     return issues
 
 
-def detect_address_overlaps(
-    addresses: List[AddressEntry],
+def _covers_window(entry: _E, *, window_start: date, window_end: date) -> bool:
+    """True if the entry alone spans all of [window_start, window_end]."""
+    if window_start > window_end:
+        # inverted window: defer to the sweep so behavior matches the unshortcut path
+        return False
+    start, end = entry_bounds(entry.date_from, entry.from_precision, entry.date_to, entry.to_precision)
+    return start <= window_start.toordinal() and (end is None or end >= window_end.toordinal())
+
+
+def _detect_gaps(
+    entries: List[_E],
+    kind: _HistoryKind,
     *,
     window_start: date,
     window_end: date,
 ) -> List[Issue]:
-    """
-    Precision-aware overlap detection for residential address history.
+    if not entries:
+        return [kind.no_entries]
 
-    Overlap exists if:
-      curr_start <= prev_end
-    (i.e., two ranges claim coverage for the same day(s)).
+    # Fast path: a single entry covering the whole window cannot leave a gap.
+    if len(entries) == 1 and _covers_window(entries[0], window_start=window_start, window_end=window_end):
+        return []
 
-    Severity policy (tiny improvement):
-      - 1 day overlap   -> LOW
-      - 2–29 days       -> MEDIUM
-      - 30+ days        -> HIGH
-    """
+    # Reuse shared range builder (precision-aware + window-clamped)
+    ranges = build_ranges(entries, window_start=window_start, window_end=window_end)
+    if not ranges:
+        return [kind.no_entries_in_window]
 
-    def _overlap_severity(overlap_days: int) -> Literal["high", "medium", "low"]:
-        if overlap_days == 1:
-            return "low"
-        if overlap_days < 30:
-            return "medium"
-        return "high"
+    gaps, _overlaps, max_end = _sweep(ranges)
+    return _gap_issues(kind, ranges[0][0], gaps, max_end, window_start=window_start, window_end=window_end)
 
-    if not addresses:
+
+def _detect_overlaps(
+    entries: List[_E],
+    kind: _HistoryKind,
+    *,
+    window_start: date,
+    window_end: date,
+) -> List[Issue]:
+    # A single entry cannot overlap anything; skip building its range.
+    if len(entries) < 2:
         return []
 
-    ranges = _build_address_ranges(addresses, window_start=window_start, window_end=window_end)
+    ranges = build_ranges(entries, window_start=window_start, window_end=window_end)
     if len(ranges) < 2:
         return []
 
-    issues: List[Issue] = []
+    _gaps, overlaps, _max_end = _sweep(ranges)
+    return _overlap_issues(kind, overlaps)
 
-    prev_start, prev_end, prev_entry = ranges[0]
-
-    for curr_start, curr_end, curr_entry in ranges[1:]:
-        if curr_start <= prev_end:
-            overlap_from = curr_start
-            overlap_to = min(prev_end, curr_end)
-            overlap_days = (overlap_to - overlap_from).days + 1
-
-            issues.append(
-                Issue(
-                    severity=_overlap_severity(overlap_days),
-                    category="address_history",
-                    message=f"Overlapping residential addresses for {overlap_days} day(s): {overlap_from} to {overlap_to}.",
-                    suggested_question=(
-                        f"Two addresses appear to overlap from {overlap_from} to {overlap_to}. "
-                        "Which address was your primary residence during this period (and were you temporarily staying elsewhere)?"
-                    ),
-                )
-            )
 
-        # Advance the "active" range to whichever extends further
-        if curr_end > prev_end:
-            prev_start, prev_end, prev_entry = curr_start, curr_end, curr_entry
+def _detect_history(
+    entries: List[_E],
+    kind: _HistoryKind,
+    *,
+    window_start: date,
+    window_end: date,
+) -> Tuple[List[Issue], List[Issue]]:
+    if not entries:
+        return [kind.no_entries], []
 
-    return issues
+    # Fast path: a single entry covering the whole window has no gaps or overlaps.
+    if len(entries) == 1 and _covers_window(entries[0], window_start=window_start, window_end=window_end):
+        return [], []
+
+    ranges = build_ranges(entries, window_start=window_start, window_end=window_end)
+    if not ranges:
+        return [kind.no_entries_in_window], []
+
+    gaps, overlaps, max_end = _sweep(ranges)
+    return (
+        _gap_issues(kind, ranges[0][0], gaps, max_end, window_start=window_start, window_end=window_end),
+        _overlap_issues(kind, overlaps),
+    )
 
 
 # ======================================================
-# Employment validation
+# Address validation
 # ======================================================
 
-def _build_employment_ranges(
-    employment: List[EmploymentEntry],
+_ADDRESS = _HistoryKind(
+    category="address_history",
+    title="Address",
+    noun="address",
+    gap_question="Where did you live",
+    start_gap_hint="",
+    overlap_subject="residential addresses",
+    overlap_question="Two addresses appear to overlap",
+    overlap_follow_up=(
+        "Which address was your primary residence during this period (and were you temporarily staying elsewhere)?"
+    ),
+    no_entries=Issue(
+        severity="high",
+        category="address_history",
+        message="No residential addresses provided for the selected window.",
+        suggested_question="Please provide your residential address history for the required period.",
+    ),
+    no_entries_in_window=Issue(
+        severity="high",
+        category="address_history",
+        message="No residential addresses overlap the required window.",
+        suggested_question="Please confirm your residential address history for the required period.",
+    ),
+)
+
+
+def detect_address_gaps(
+    addresses: List[AddressEntry],
     *,
     window_start: date,
     window_end: date,
-) -> List[Tuple[date, date, EmploymentEntry]]:
+) -> List[Issue]:
     """
-    Convert EmploymentEntry records into clamped coverage ranges within [window_start, window_end].
+    Precision-aware gap detection for residential address history.
+
+    Hybrid severity policy:
+      - Start-of-window gaps: HIGH (even 1 day)
+      - End-of-window gaps:   HIGH (even 1 day)
+      - Middle gaps:
+          * 1 day   -> MEDIUM
+          * >=2 days -> HIGH
+    """
+    return _detect_gaps(addresses, _ADDRESS, window_start=window_start, window_end=window_end)
 
-    Each entry covers:
-      start = earliest possible date based on from_precision
-      end   = latest possible date based on to_precision
 
-    date_to=None means "Present", treated as covering through window_end with day precision.
+def detect_address_overlaps(
+    addresses: List[AddressEntry],
+    *,
+    window_start: date,
+    window_end: date,
+) -> List[Issue]:
     """
-    ranges: List[Tuple[date, date, EmploymentEntry]] = []
+    Precision-aware overlap detection for residential address history.
+
+    Overlap exists if:
+      curr_start <= prev_end
+    (i.e., two ranges claim coverage for the same day(s)).
 
-    for entry in employment:
-        start = _precision_range_start(DateWithPrecision(entry.date_from, entry.from_precision))
+    Severity policy (tiny improvement):
+      - 1 day overlap   -> LOW
+      - 2–29 days       -> MEDIUM
+      - 30+ days        -> HIGH
+    """
+    return _detect_overlaps(addresses, _ADDRESS, window_start=window_start, window_end=window_end)
 
-        effective_end = entry.date_to or window_end
-        end_precision: DatePrecision = entry.to_precision if entry.date_to is not None else "day"
-        end = _precision_range_end(DateWithPrecision(effective_end, end_precision))
 
-        # Ignore entries fully outside window
-        if end < window_start or start > window_end:
-            continue
+def detect_address_history(
+    addresses: List[AddressEntry],
+    *,
+    window_start: date,
+    window_end: date,
+) -> Tuple[List[Issue], List[Issue]]:
+    """
+    (detect_address_gaps(...), detect_address_overlaps(...)) from a single
+    range build and sweep; use this when a caller needs both.
+    """
+    return _detect_history(addresses, _ADDRESS, window_start=window_start, window_end=window_end)
 
-        # Clamp to window
-        start = max(start, window_start)
-        end = min(end, window_end)
 
-        ranges.append((start, end, entry))
+# ======================================================
+# Employment validation
+# ======================================================
 
-    ranges.sort(key=lambda x: (x[0], x[1]))
-    return ranges
+_EMPLOYMENT = _HistoryKind(
+    category="employment",
+    title="Employment",
+    noun="employment",
+    gap_question="What was your employment status",
+    start_gap_hint=" (employed, self-employed, unemployed)",
+    overlap_subject="employment entries",
+    overlap_question="Two employment entries overlap",
+    overlap_follow_up=(
+        "Did you hold multiple jobs at the same time, or should one job’s end/start date be corrected?"
+    ),
+    no_entries=Issue(
+        severity="high",
+        category="employment",
+        message="No employment history provided for the selected window.",
+        suggested_question="Please provide your employment history (including unemployment) for the required period.",
+    ),
+    no_entries_in_window=Issue(
+        severity="high",
+        category="employment",
+        message="No employment entries overlap the required window.",
+        suggested_question="Please confirm your employment history for the required period.",
+    ),
+)
 
 
 def detect_employment_gaps(
@@ -309,84 +363,8 @@ def detect_employment_gaps(
       - This treats ANY employment entry as coverage, including 'unemployed',
         which is usually what USCIS wants (continuity + explanation).
     """
+    return _detect_gaps(employment, _EMPLOYMENT, window_start=window_start, window_end=window_end)
 
-    def _middle_gap_severity(gap_days: int) -> Literal["high", "medium"]:
-        return "medium" if gap_days == 1 else "high"
-
-    if not employment:
-        return [
-            Issue(
-                severity="high",
-                category="employment",
-                message="No employment history provided for the selected window.",
-                suggested_question="Please provide your employment history (including unemployment) for the required period.",
-            )
-        ]
-
-    raw_ranges = _build_employment_ranges(employment, window_start=window_start, window_end=window_end)
-
-    if not raw_ranges:
-        return [
-            Issue(
-                severity="high",
-                category="employment",
-                message="No employment entries overlap the required window.",
-                suggested_question="Please confirm your employment history for the required period.",
-            )
-        ]
-
-    # We only need (start, end) for gap math
-    ranges = [(start, end) for start, end, _entry in raw_ranges]
-
-    issues: List[Issue] = []
-
-    # Start gap (always HIGH)
-    first_start = ranges[0][0]
-    if first_start > window_start:
-        gap_from = window_start
-        gap_to = first_start - timedelta(days=1)
-        issues.append(
-            Issue(
-                severity="high",
-                category="employment",
-                message=f"Employment gap at the start of the window: {gap_from} to {gap_to}.",
-                suggested_question=f"What was your employment status from {gap_from} to {gap_to} (employed, self-employed, unemployed)?",
-            )
-        )
-
-    # Middle gaps (track high-water mark to handle nested/overlapping ranges)
-    current_max_end = ranges[0][1]
-    for curr_start, curr_end in ranges[1:]:
-        if curr_start > current_max_end + timedelta(days=1):
-            gap_from = current_max_end + timedelta(days=1)
-            gap_to = curr_start - timedelta(days=1)
-            gap_days = (gap_to - gap_from).days + 1
-
-            issues.append(
-                Issue(
-                    severity=_middle_gap_severity(gap_days),
-                    category="employment",
-                    message=f"Unexplained employment gap of {gap_days} day(s): {gap_from} to {gap_to}.",
-                    suggested_question=f"What was your employment status from {gap_from} to {gap_to}?",
-                )
-            )
-
-        current_max_end = max(current_max_end, curr_end)
-
-    # End gap (always HIGH)
-    if current_max_end < window_end:
-        gap_from = current_max_end + timedelta(days=1)
-        gap_to = window_end
-        issues.append(
-            Issue(
-                severity="high",
-                category="employment",
-                message=f"Employment gap at the end of the window: {gap_from} to {gap_to}.",
-                suggested_question=f"What was your employment status from {gap_from} to {gap_to}?",
-            )
-        )
-
-    return issues
 
 def detect_employment_overlaps(
     employment: List[EmploymentEntry],
@@ -408,49 +386,17 @@ def detect_employment_overlaps(
       - 2–29 days       -> MEDIUM
       - 30+ days        -> HIGH
     """
+    return _detect_overlaps(employment, _EMPLOYMENT, window_start=window_start, window_end=window_end)
 
-    def _overlap_severity(overlap_days: int) -> Literal["high", "medium", "low"]:
-        if overlap_days == 1:
-            return "low"
-        if overlap_days < 30:
-            return "medium"
-        return "high"
-
-    if not employment:
-        return []
-
-    ranges = _build_employment_ranges(employment, window_start=window_start, window_end=window_end)
-    if len(ranges) < 2:
-        return []
-
-    issues: List[Issue] = []
-
-    prev_start, prev_end, prev_entry = ranges[0]
-
-    for curr_start, curr_end, curr_entry in ranges[1:]:
-        if curr_start <= prev_end:
-            overlap_from = curr_start
-            overlap_to = min(prev_end, curr_end)
-            overlap_days = (overlap_to - overlap_from).days + 1
-
-            issues.append(
-                Issue(
-                    severity=_overlap_severity(overlap_days),
-                    category="employment",
-                    message=(
-                        f"Overlapping employment entries for {overlap_days} day(s): "
-                        f"{overlap_from} to {overlap_to}."
-                    ),
-                    suggested_question=(
-                        f"Two employment entries overlap from {overlap_from} to {overlap_to}. "
-                        "Did you hold multiple jobs at the same time, or should one job’s end/start date be corrected?"
-                    ),
-                )
-            )
-
-        # Advance to whichever range extends further
-        if curr_end > prev_end:
-            prev_start, prev_end, prev_entry = curr_start, curr_end, curr_entry
-
-    return issues
 
+def detect_employment_history(
+    employment: List[EmploymentEntry],
+    *,
+    window_start: date,
+    window_end: date,
+) -> Tuple[List[Issue], List[Issue]]:
+    """
+    (detect_employment_gaps(...), detect_employment_overlaps(...)) from a
+    single range build and sweep; use this when a caller needs both.
+    """
+    return _detect_history(employment, _EMPLOYMENT, window_start=window_start, window_end=window_end)